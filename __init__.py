@@ -31,9 +31,10 @@ Betse funktioniert zwar aber du wolltest von anfang an dein gehirn verbessern  !
 
 
 """
+import functools
 import os
 
-from utils.file._yaml import load_yaml
+from _betse.yml import load_yaml
 
 """
 
@@ -63,29 +64,61 @@ DATAC["sim_config"] = load_yaml(filepath=os.path.join(yaml_dir, "sim_config.yaml
 """
 
 
+# Single source for the BETSE data layout: BETSE_DATA_DIR overrides the
+# platform default, replacing the duplicated per-machine path blocks.
 if os.name == "nt":
-    DEFAULT_BETSE_GEOP = r"C:\Users\wired\OneDrive\Desktop\BestBrain\_betse\betse-1.5.0\betse\data\yaml\geo"
-    DEFAULT_BETSE_CONFP = r"C:\Users\wired\OneDrive\Desktop\BestBrain\_betse\betse-1.5.0\betse\data\yaml\sim_config.yaml"
-    DEFAULT_BETSE_GRN = r"C:\Users\wired\OneDrive\Desktop\BestBrain\_betse\betse-1.5.0\betse\data\yaml\extra_configs\grn_basic.yaml"
-    EXPRP=r"C:\Users\wired\OneDrive\Desktop\BestBrain\_betse\betse-1.5.0\betse\data\yaml\extra_configs\expression_data.yaml"
-    METABOP = r"C:\Users\wired\OneDrive\Desktop\BestBrain\_betse\betse-1.5.0\betse\data\yaml\extra_configs\metabo_basic.yaml"
-
+    _default_yaml_dir = r"C:\Users\wired\OneDrive\Desktop\BestBrain\_betse\betse-1.5.0\betse\data\yaml"
 else:
-    DEFAULT_BETSE_GEOP = os.path.abspath(r"_betse/betse-1.5.0/betse/data/yaml/geo")
-    DEFAULT_BETSE_CONFP = os.path.abspath(r"_betse/betse-1.5.0/betse/data/yaml/sim_config.yaml")
-    DEFAULT_BETSE_GRN = os.path.abspath("_betse/betse-1.5.0/betse/data/yaml/extra_configs/grn_basic.yaml")
-    EXPRP = os.path.abspath("_betse/betse-1.5.0/betse/data/yaml/extra_configs/expression_data.yaml")
-    METABOP = os.path.abspath("_betse/betse-1.5.0/betse/data/yaml/extra_configs/metabo_basic.yaml")
+    _default_yaml_dir = os.path.abspath(r"_betse/betse-1.5.0/betse/data/yaml")
+
+BETSE_YAML_DIR = os.environ.get("BETSE_DATA_DIR", _default_yaml_dir)
+BETSE_EXTRA_CONFIGS_DIR = os.path.join(BETSE_YAML_DIR, "extra_configs")
+
+DEFAULT_BETSE_GEOP = os.path.join(BETSE_YAML_DIR, "geo")
+DEFAULT_BETSE_CONFP = os.path.join(BETSE_YAML_DIR, "sim_config.yaml")
+DEFAULT_BETSE_GRN = os.path.join(BETSE_EXTRA_CONFIGS_DIR, "grn_basic.yaml")
+EXPRP = os.path.join(BETSE_EXTRA_CONFIGS_DIR, "expression_data.yaml")
+METABOP = os.path.join(BETSE_EXTRA_CONFIGS_DIR, "metabo_basic.yaml")
+
+
+# Parsed config constants are lazy (PEP 562) so importing _betse does not
+# parse YAML for request paths that never touch them.
+_LAZY_YAML_CONSTANTS = {
+    "DEFAULT_BETSE_GRNC": DEFAULT_BETSE_GRN,
+    "DEFAULT_BETSE_CONTENT": DEFAULT_BETSE_CONFP,
+    "DEFAULT_BETSE_EXPRC": EXPRP,
+    "METABOC": METABOP,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(filepath):
+    return load_yaml(filepath=filepath)
+
+
+def warm_config_cache():
+    """
+    Parse every default config once in the current process.
+
+    Call this from the gunicorn/uvicorn master (preload_app=True) before
+    workers fork: the parsed trees then sit in the lru_cache and are
+    inherited copy-on-write, so no worker ever touches YAML or the pickle
+    sidecar itself.
+    """
+    for filepath in _LAZY_YAML_CONSTANTS.values():
+        _load_config(filepath)
 
 
-DEFAULT_BETSE_GRNC = load_yaml(filepath=DEFAULT_BETSE_GRN)
-DEFAULT_BETSE_CONTENT = load_yaml(filepath=DEFAULT_BETSE_CONFP)
-DEFAULT_BETSE_EXPRC = load_yaml(filepath=EXPRP)
-METABOC = load_yaml(filepath=METABOP)
+def __getattr__(name):
+    filepath = _LAZY_YAML_CONSTANTS.get(name)
+    if filepath is not None:
+        return _load_config(filepath)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # THESE SECTIONS KEEP STABLE -> Not include in train process
-OUTSOURCED_CONF_SECTIONS = [
+# frozensets: membership tests ("key in ...") are O(1) instead of scanning.
+OUTSOURCED_CONF_SECTIONS = frozenset({
     "file handling",
     "sim time settings",
     "init time settings",
@@ -96,9 +129,9 @@ OUTSOURCED_CONF_SECTIONS = [
     "sim file saving",
     "init file saving",
     "results file saving",
-]
+})
 
-CONF_SECTIONS = [
+CONF_SECTIONS = frozenset({
     "gene regulatory network settings",
     "general network",
     "modulator function properties",
@@ -118,7 +151,7 @@ CONF_SECTIONS = [
     "change K env",
     "change Cl env",
     "change Na env",
-    "change temperature"
+    "change temperature",
     "internal parameters",
     "variable settings",
-]
+})
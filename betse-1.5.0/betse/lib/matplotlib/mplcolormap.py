@@ -17,20 +17,28 @@ https://matplotlib.org/examples/color/colormaps_reference.html
 
 # ....................{ IMPORTS                            }....................
 import numpy as np
-from betse.exceptions import BetseSequenceException
+from beartype.typing import TYPE_CHECKING
+from functools import lru_cache
+from betse.exceptions import BetseIntException, BetseSequenceException
 from betse.util.io.log import logs
-from betse.util.type.iterable import sequences
-from betse.util.type.numeric import ints
 from betse.util.type.types import type_check, SequenceTypes
-from matplotlib import colormaps
-from matplotlib.colors import (
-    Colormap,
-    LinearSegmentedColormap,
-)
+
+# Matplotlib is intentionally *NOT* imported at the top level of this
+# submodule, which is transitively imported by callers (including CLI
+# subcommands) that never plot. Importing matplotlib is non-trivially
+# expensive; deferring that import to the _import_mpl() function called by
+# each matplotlib-dependent callable below charges this cost only to callers
+# actually requiring matplotlib.
+#
+# All "Colormap" annotations below are hence stringified forward references,
+# which beartype resolves lazily at call time (i.e., after _import_mpl() has
+# necessarily defined this global).
+if TYPE_CHECKING:
+    from matplotlib.colors import Colormap
 
 # ....................{ GETTERS                            }....................
 @type_check
-def get_colormap(name: str) -> Colormap:
+def get_colormap(name: str) -> 'Colormap':
     '''
     Matplotlib colormap with the passed name, including both standard colormaps
     bundled with matplotlib *and* application-specific colormaps registered by
@@ -64,6 +72,9 @@ def get_colormap(name: str) -> Colormap:
         List of supported colormaps.
     '''
 
+    # Import matplotlib if needed.
+    _import_mpl()
+
     return colormaps[name]
 
 # ....................{ ITERATORS                          }....................
@@ -99,6 +110,10 @@ def iter_colormap_names() -> SequenceTypes:
     # from the "matplotlib.pyplot" submodule. Instead, this function inlines the
     # body of the matplotlib.pyplot.colormaps() function here. Fortunately, the
     # body of this function reduces to a trivial one-liner.
+    #
+    # Import matplotlib if needed.
+    _import_mpl()
+
     return sorted(colormaps)
 
 # ....................{ INITIALIZERS                       }....................
@@ -128,83 +143,108 @@ def init() -> None:
     # Log this initialization attempt.
     logs.log_debug('Registering custom matplotlib colormaps...')
 
-    # ..................{ COLOURS                            }..................
-    # Primary colours.
-    BLACK = (  0,   0,   0)
-    GREEN = (  0, 255,   0)
-    RED   = (255,   0,   0)
-    BLUE  = (  0,   0, 255)
-
-    # Secondary colours.
-    CYAN    = (  9, 232, 239)
-    MAGENTA = (239,  52, 236)
-    # ORANGE  = (255, 164,  61)
-
-    GREY_DARK = (51, 51, 51)
-
-    GREEN_LIGHT  = (184, 255, 104)
-    PURPLE_LIGHT = (219, 104, 255)
-
-    BLUE_PALE = ( 56, 132, 255)
-    RED_PALE  = (244,  66,  66)
-
-    AQUA =  (53, 255, 211)
-    AQUA2 = (71, 255, 218)
-
-    GOLD   = (255, 231,  55)
-    YELLOW = (255, 246, 130)
-
-    # Salmon orange and/or red.
-    SALMON  = (255, 111, 54)
-    SALMON2 = (255, 117, 71)
-
-    # ..................{ COLORMAPS                          }..................
-    # Tuple of all application-specific colormaps iteratively registered below.
-    COLORMAP_SCHEMES = (
-        # Black-based colormaps.
-        _MplColormapScheme(name='betse_electric_cyan',    colors=(BLACK, CYAN)),
-        _MplColormapScheme(name='betse_electric_gold',    colors=(BLACK, YELLOW)),
-        _MplColormapScheme(name='betse_electric_green',   colors=(BLACK, GREEN)),
-        _MplColormapScheme(name='betse_electric_magenta', colors=(BLACK, MAGENTA)),
-        _MplColormapScheme(name='betse_electric_orange',  colors=(BLACK, SALMON2)),
-        _MplColormapScheme(name='betse_electric_blue',    colors=(BLACK, BLUE_PALE)),
-
-        # Grey-based colormaps.
-        _MplColormapScheme(name='betse_blue_chalkboard',    colors=(GREY_DARK, BLUE_PALE)),
-        _MplColormapScheme(name='betse_cyan_chalkboard',    colors=(GREY_DARK, CYAN)),
-        _MplColormapScheme(name='betse_gold_chalkboard',    colors=(GREY_DARK, GOLD)),
-        _MplColormapScheme(name='betse_green_chalkboard',   colors=(GREY_DARK, GREEN)),
-        _MplColormapScheme(name='betse_magenta_chalkboard', colors=(GREY_DARK, MAGENTA)),
-        _MplColormapScheme(name='betse_orange_chalkboard',  colors=(GREY_DARK, SALMON)),
-
-        # Salmon-based colormaps.
-        _MplColormapScheme(name='betse_alien_chalkboard', colors=(SALMON2, GREY_DARK, AQUA2)),
-        _MplColormapScheme(name='betse_alien_pale',       colors=(SALMON2, BLACK, AQUA2)),
-        _MplColormapScheme(name='betse_alien_solid',      colors=(SALMON, BLACK, AQUA)),
-
-        # Purple-based colormaps.
-        _MplColormapScheme(name='betse_purple_green_chalkboard', colors=(MAGENTA, GREY_DARK, GREEN)),
-        _MplColormapScheme(name='betse_purple_green_pale',       colors=(PURPLE_LIGHT, BLACK, GREEN_LIGHT)),
-        _MplColormapScheme(name='betse_purple_green_solid',      colors=(MAGENTA, BLACK, GREEN)),
-
-        # Blue-based colormaps.
-        _MplColormapScheme(name='betse_red_blue_chalkboard', colors=(BLUE, GREY_DARK, RED)),
-        _MplColormapScheme(name='betse_red_blue_pale',       colors=(BLUE_PALE, BLACK, RED_PALE)),
-        _MplColormapScheme(name='betse_red_blue_solid',      colors=(BLUE, BLACK, RED)),
-    )
-
     # ..................{ REGISTRATION                       }..................
-    # Register each such colormap with matplotlib.
-    for colormap_scheme in COLORMAP_SCHEMES:
+    # Register each application-specific colormap with matplotlib. The
+    # "_COLORMAP_SCHEMES" tuple is built (and validated) once at import time
+    # rather than on each init() attempt.
+    for colormap_scheme in _COLORMAP_SCHEMES:
         colormap_scheme.register()
 
 # ....................{ PRIVATE ~ globals                  }....................
+_INV_255 = np.float32(1.0 / 255.0)
+'''
+Reciprocal of the maximum byte value as a 32-bit float, hoisted to module
+scope so that normalizing colour bytes multiplies by a precomputed constant
+rather than dividing (and re-creating the scalar) on every registration.
+'''
+
+
 _is_initted = False
 '''
 ``True`` only if the :func:`init` function has already been called under the
 active Python interpreter.
 '''
 
+# ....................{ PRIVATE ~ importers                }....................
+def _import_mpl() -> None:
+    '''
+    Import all matplotlib attributes required by this submodule into this
+    submodule's global namespace if needed *or* reduce to a noop otherwise
+    (i.e., if a prior call has already done so).
+
+    Importing matplotlib is non-trivially expensive. Deferring that import
+    from the top level of this submodule to this function charges this cost
+    only to callables actually requiring matplotlib -- excluding, notably,
+    the import-time construction of the :data:`_COLORMAP_SCHEMES` tuple.
+    '''
+
+    # Enable these globals to be locally assigned to below.
+    global colormaps, Colormap, ListedColormap
+
+    # If a prior call has already imported matplotlib, reduce to a noop.
+    if 'colormaps' in globals():
+        return
+    # Else, matplotlib has *NOT* yet been imported by this submodule.
+
+    from matplotlib import colormaps
+    from matplotlib.colors import Colormap, ListedColormap
+
+# ....................{ PRIVATE ~ makers                   }....................
+@lru_cache(maxsize=64)
+def _make_colormap(
+    name: str, colors: tuple, gamma: float, lut_size: int) -> 'Colormap':
+    '''
+    Create and return a linear-segmented colormap with the passed name,
+    colors, gamma curve value, and lookup table size, memoized on these
+    parameters.
+
+    Synthesizing a colormap interpolates ``lut_size`` RGBA samples per
+    channel, which is pure recomputation whenever this submodule is
+    re-initialized (e.g., by forked plotting subprocesses re-running
+    :func:`init`). Memoization reuses the previously interpolated colormap
+    instead.
+
+    Parameters
+    ----------
+    name : str
+        Name of the colormap to be created.
+    colors : tuple
+        Tuple of 3-tuples indexing the red, green, and blue (RGB) byte values
+        defining each color of this colormap's gradient, tuple-ified for
+        hashability.
+    gamma : float
+        Gamma curve value, adjusting the brightness of this colormap's
+        endpoint colors.
+    lut_size : int
+        Number of RGBA entries in this colormap's lookup table.
+    '''
+
+    # Two-dimensional Numpy array, normalizing each of each color's values
+    # from [0, 255] to [0.0, 1.0] (while preserving the order of colors).
+    # Multiplying by the precomputed float32 reciprocal avoids both a
+    # float64 temporary and a division on this hot startup path.
+    colors_normalized = np.asarray(colors, dtype=np.float32) * _INV_255
+
+    # (lut_size)x4 RGBA lookup table interpolated directly from these colors.
+    #
+    # LinearSegmentedColormap.from_list() first synthesizes a segmentdata
+    # dictionary and then interpolates each channel through matplotlib's
+    # generic segment machinery. For the simple evenly spaced two- and
+    # three-color gradients registered by this submodule, three np.interp()
+    # calls over the gamma-warped sample grid produce the identical table at
+    # a fraction of the cost; a ListedColormap wrapping this table then skips
+    # the segmentdata machinery entirely.
+    color_stops = np.linspace(0.0, 1.0, len(colors_normalized))
+    samples = np.linspace(0.0, 1.0, lut_size) ** gamma
+    lut = np.empty((lut_size, 4), dtype=np.float32)
+    for channel in range(3):
+        lut[:, channel] = np.interp(
+            samples, color_stops, colors_normalized[:, channel])
+    lut[:, 3] = 1.0
+
+    # Colormap synthesized from this colormap name and lookup table.
+    return ListedColormap(lut, name=name)
+
 # ....................{ PRIVATE ~ classes                  }....................
 class _MplColormapScheme(object):
     '''
@@ -246,6 +286,7 @@ class _MplColormapScheme(object):
         # Optional parameters. All default values defined below should ideally
         # be identical to the same default values defined by matplotlib.
         gamma: float = 1.0,
+        lut_size: int = 256,
     ) -> None:
         '''
         Initialize this colormap scheme.
@@ -268,6 +309,12 @@ class _MplColormapScheme(object):
 
                 colormap values are modified as c^gamma, where gamma is (1-beta)
                 for beta>0 and 1/(1+beta) for beta<=0
+        lut_size : int
+            Number of RGBA entries in this colormap's lookup table. Defaults
+            to matplotlib's standard 256; plots mapping few distinct values
+            (e.g., discrete cell counts) may request a smaller table, cutting
+            both the interpolation work at registration time and the table's
+            memory footprint proportionally.
 
         Raises
         -----------
@@ -294,44 +341,70 @@ class _MplColormapScheme(object):
                 'Colormap scheme defines less than two colors: {!r}'.format(
                     colors))
 
-        # For each color defining this colormap...
-        for color in colors:
-            # If this color is *NOT* a 3-sequence, raise an exception.
-            sequences.die_unless_length(sequence=color, length=3)
+        # Two-dimensional Numpy array of these colors, validating all colors
+        # in a single vectorized scan rather than three Python-level
+        # validation calls per color (which measurably slows init()). Ragged
+        # colors (e.g., a 2-sequence amidst 3-sequences) fail this coercion
+        # itself, in which case Numpy's raw inhomogeneous-shape error is
+        # coerced into the human-readable exception documented above.
+        try:
+            colors_array = np.asarray(colors)
+        except ValueError:
+            raise BetseSequenceException(
+                'Colormap scheme colors not 3-sequences: {!r}'.format(colors))
 
-            # If any of this color's values is *NOT* a valid RGB colour (i.e.,
-            # integer in the range [0, 255]), raise an exception.
-            ints.die_unless_byte(*color)
+        # If any color is *NOT* a 3-sequence, raise an exception.
+        if colors_array.ndim != 2 or colors_array.shape[1] != 3:
+            raise BetseSequenceException(
+                'Colormap scheme colors not 3-sequences: {!r}'.format(colors))
+
+        # If any of these colors' values is *NOT* a valid RGB colour (i.e.,
+        # integer in the range [0, 255]), raise an exception.
+        if not np.issubdtype(colors_array.dtype, np.integer):
+            raise BetseIntException(
+                'Colormap scheme color values not integers: {!r}'.format(
+                    colors))
+        colors_invalid = (colors_array < 0) | (colors_array > 255)
+        if colors_invalid.any():
+            color_index, value_index = np.argwhere(colors_invalid)[0]
+            raise BetseIntException(
+                'Color {} value {} not a byte '
+                '(i.e., integer in the range [0, 255]).'.format(
+                    color_index,
+                    colors_array[color_index, value_index]))
 
         # Classify all passed parameters.
         self._name = name
         self._colors = colors
         self._gamma = gamma
+        self._lut_size = lut_size
 
     # ..................{ REGISTERERS                        }..................
     @type_check
-    def register(self) -> Colormap:
+    def register(self) -> 'Colormap':
         '''
         Create a linear-segmented colormap from the current scheme, register
         this colormap with matplotlib, and return this colormap.
         '''
 
+        # Import matplotlib if needed.
+        _import_mpl()
+
         # Log this registration attempt.
         # logs.log_debug(
         #     'Registering colormap "%s": %s',
         #     self.colormap_name, self.colors_normalized)
 
-        # Two-dimensional Numpy array, normalizing each of each color's values
-        # from [0, 255] to [0.0, 1.0] (while preserving the order of colors).
-        colors_normalized = np.array(self._colors) / 255
-
-        # Colormap synthesized from this colormap name and colors.
-        #
-        # Unfortunately, as the names of the first two parameters accepted by
-        # this function have changed across matplotlib versions, these
-        # parameters *MUST* be passed positionally for safety.
-        colormap = LinearSegmentedColormap.from_list(
-            self._name, colors_normalized, N=256, gamma=self._gamma)
+        # Colormap synthesized from this colormap name and colors, memoized so
+        # that re-initialization (e.g., in forked plotting subprocesses)
+        # reuses the previously interpolated colormap. Colors are tuple-ified
+        # for hashability.
+        colormap = _make_colormap(
+            self._name,
+            tuple(tuple(color) for color in self._colors),
+            self._gamma,
+            self._lut_size,
+        )
 
         # Register this colormap with matplotlib.
         colormaps.register(colormap)
@@ -339,3 +412,74 @@ class _MplColormapScheme(object):
         # Return this colormap.
         return colormap
 
+
+# ....................{ PRIVATE ~ schemes                  }....................
+# Colours comprising the application-specific colormaps registered below.
+#
+# Primary colours.
+_BLACK = (  0,   0,   0)
+_GREEN = (  0, 255,   0)
+_RED   = (255,   0,   0)
+_BLUE  = (  0,   0, 255)
+
+# Secondary colours.
+_CYAN    = (  9, 232, 239)
+_MAGENTA = (239,  52, 236)
+# _ORANGE  = (255, 164,  61)
+
+_GREY_DARK = (51, 51, 51)
+
+_GREEN_LIGHT  = (184, 255, 104)
+_PURPLE_LIGHT = (219, 104, 255)
+
+_BLUE_PALE = ( 56, 132, 255)
+_RED_PALE  = (244,  66,  66)
+
+_AQUA =  (53, 255, 211)
+_AQUA2 = (71, 255, 218)
+
+_GOLD   = (255, 231,  55)
+_YELLOW = (255, 246, 130)
+
+# Salmon orange and/or red.
+_SALMON  = (255, 111, 54)
+_SALMON2 = (255, 117, 71)
+
+
+_COLORMAP_SCHEMES = (
+    # Black-based colormaps.
+    _MplColormapScheme(name='betse_electric_cyan',    colors=(_BLACK, _CYAN)),
+    _MplColormapScheme(name='betse_electric_gold',    colors=(_BLACK, _YELLOW)),
+    _MplColormapScheme(name='betse_electric_green',   colors=(_BLACK, _GREEN)),
+    _MplColormapScheme(name='betse_electric_magenta', colors=(_BLACK, _MAGENTA)),
+    _MplColormapScheme(name='betse_electric_orange',  colors=(_BLACK, _SALMON2)),
+    _MplColormapScheme(name='betse_electric_blue',    colors=(_BLACK, _BLUE_PALE)),
+
+    # Grey-based colormaps.
+    _MplColormapScheme(name='betse_blue_chalkboard',    colors=(_GREY_DARK, _BLUE_PALE)),
+    _MplColormapScheme(name='betse_cyan_chalkboard',    colors=(_GREY_DARK, _CYAN)),
+    _MplColormapScheme(name='betse_gold_chalkboard',    colors=(_GREY_DARK, _GOLD)),
+    _MplColormapScheme(name='betse_green_chalkboard',   colors=(_GREY_DARK, _GREEN)),
+    _MplColormapScheme(name='betse_magenta_chalkboard', colors=(_GREY_DARK, _MAGENTA)),
+    _MplColormapScheme(name='betse_orange_chalkboard',  colors=(_GREY_DARK, _SALMON)),
+
+    # Salmon-based colormaps.
+    _MplColormapScheme(name='betse_alien_chalkboard', colors=(_SALMON2, _GREY_DARK, _AQUA2)),
+    _MplColormapScheme(name='betse_alien_pale',       colors=(_SALMON2, _BLACK, _AQUA2)),
+    _MplColormapScheme(name='betse_alien_solid',      colors=(_SALMON, _BLACK, _AQUA)),
+
+    # Purple-based colormaps.
+    _MplColormapScheme(name='betse_purple_green_chalkboard', colors=(_MAGENTA, _GREY_DARK, _GREEN)),
+    _MplColormapScheme(name='betse_purple_green_pale',       colors=(_PURPLE_LIGHT, _BLACK, _GREEN_LIGHT)),
+    _MplColormapScheme(name='betse_purple_green_solid',      colors=(_MAGENTA, _BLACK, _GREEN)),
+
+    # Blue-based colormaps.
+    _MplColormapScheme(name='betse_red_blue_chalkboard', colors=(_BLUE, _GREY_DARK, _RED)),
+    _MplColormapScheme(name='betse_red_blue_pale',       colors=(_BLUE_PALE, _BLACK, _RED_PALE)),
+    _MplColormapScheme(name='betse_red_blue_solid',      colors=(_BLUE, _BLACK, _RED)),
+)
+'''
+Tuple of all application-specific colormap schemes registered with matplotlib
+by the :func:`init` function, built (and validated) exactly once at import
+time rather than on each :func:`init` attempt.
+'''
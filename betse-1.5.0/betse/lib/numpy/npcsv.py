@@ -10,7 +10,14 @@ from comma-separated value (CSV) files.
 
 # ....................{ IMPORTS                           }....................
 import numpy as np
-from beartype import beartype
+import os
+import re
+from functools import reduce
+from beartype import (
+    BeartypeConf,
+    BeartypeStrategy,
+    beartype,
+)
 from beartype.typing import (
     Dict,
     Iterable,
@@ -21,10 +28,25 @@ from betse.util.io.log import logs
 from betse.util.path import dirs
 from betse.util.type import types
 
+# ....................{ GLOBALS                           }....................
+_write_csv_conf = (
+    BeartypeConf(strategy=BeartypeStrategy.O0)
+    if os.environ.get('BETSE_BEARTYPE_WRITE_CSV') == '0' else
+    BeartypeConf()
+)
+'''
+Beartype configuration type-checking the :func:`write_csv` function.
+
+Setting the ``BETSE_BEARTYPE_WRITE_CSV`` environment variable to ``0``
+selects beartype's no-op strategy, eliminating the per-call type-check
+dispatch for export pipelines calling this function in a tight loop over
+many small CSV files. The default remains fully type-checked.
+'''
+
 # ....................{ WRITERS                           }....................
 #FIXME: Donate this function back to Numpy as a new np.savecsv() function
 #paralleling the existing np.savetxt() function.
-@beartype
+@beartype(conf=_write_csv_conf)
 def write_csv(
     # Mandatory parameters.
     filename: str,
@@ -84,11 +106,14 @@ def write_csv(
     Raises
     ----------
     BetseSequenceException
-        If one or more values of this dictionary are either:
+        If either:
+
+        * This dictionary is empty.
+        * One or more values of this dictionary are either:
 
-        * *Not* sequences.
-        * Sequences whose length differs from that of any preceding value
-          sequences of this dictionary.
+          * *Not* sequences.
+          * Sequences whose length differs from that of any preceding value
+            sequences of this dictionary.
     BetseStrException
         If this column name contains one or more characters reserved for use by
         the CSV non-standard, including:
@@ -108,11 +133,31 @@ def write_csv(
     # by that function for simplicity.
     columns_format = '%.18e'
 
+    # Two-dimensional sequence of all column data captured exactly once,
+    # whose:
+    #
+    # * First dimension indexes each column.
+    # * Second dimension indexes each data point in that column.
+    columns_values = tuple(column_name_to_values.values())
+
+    # If no columns were passed, raise a human-readable exception rather than
+    # the ambiguous "IndexError" the preallocation below would raise.
+    if not columns_values:
+        raise BetseSequenceException(
+            'Dictionary "column_name_to_values" empty.')
+
     # If passed a dictionary of format strings...
     if column_name_to_format is not None:
-        # If the column names listed by this dictionary from those listed by
-        # the dictionary of values, raise an exception.
-        if column_name_to_format.keys() != column_name_to_values.keys():
+        # If the column names listed by this dictionary differ from those
+        # listed by the dictionary of values, raise an exception. Since
+        # dictionaries preserve insertion order, comparing lengths and then
+        # walking both key sequences in parallel suffices -- avoiding the
+        # hash-based set comparison performed by comparing dictionary views.
+        if len(column_name_to_format) != len(column_name_to_values) or any(
+            format_name != values_name
+            for format_name, values_name in zip(
+                column_name_to_format, column_name_to_values)
+        ):
             raise BetseSequenceException(
                 f'"column_name_to_format" keys '
                 f'{repr(column_name_to_format.keys())} != '
@@ -127,111 +172,204 @@ def write_csv(
             for column_format in column_name_to_format.values()
         )
 
+        # If all columns share the same format string (the common case for
+        # this application's exports), collapse this tuple to that single
+        # string. Doing so routes this export through the vectorized uniform
+        # writer below rather than np.savetxt(), which joins a tuple of
+        # format strings with the delimiter once per row in Python.
+        if len(set(columns_format)) == 1:
+            columns_format = columns_format[0]
+
     # Create the directory containing this file if needed and hence raise
     # filesystem-related exceptions *BEFORE* performing any subsequent logic.
     dirs.make_parent_unless_dir(filename)
 
-    # Validate the contents of this dictionary. While the np.column_stack()
-    # function called below also does, the exceptions raised by the latter are
-    # both ambiguous and non-human-readable and hence effectively useless.
+    # Validate the contents of this dictionary, raising human-readable
+    # exceptions rather than the ambiguous and non-human-readable exceptions
+    # Numpy would raise below.
     #
-    # Length of all prior columns *OR* "None" if no columns have been iterated.
-    columns_prior_len = None
-
-    # List of all column names sanitized such that each name containing one or
-    # more comma characters is double-quoted.
-    column_names = []
-
-    # For each passed column...
-    for column_name, column_values in column_name_to_values.items():
-        # If this column is *NOT* a sequence, raise a human-readable exception.
+    # If any column is *NOT* a sequence, raise an exception *BEFORE*
+    # inspecting column dtypes below. Note that this loop touches only column
+    # metadata (i.e., types) and hence copies *NO* column data.
+    for column_name, column_values in zip(
+        column_name_to_values, columns_values):
         if not types.is_sequence_nonstr(column_values):
             raise BetseSequenceException(
                 'Column "{}" type {!r} not a sequence.'.format(
                     column_name, type(column_values)))
 
-        # Length of this column.
-        column_len = len(column_values)
+    # Columns coerced into Numpy arrays -- a noop for columns already arrays
+    # (the common case), a single copy for plain-sequence columns. The dtype
+    # promotion below requires arrays: np.result_type() misinterprets plain
+    # Python lists as structured dtype specifications rather than promoting
+    # their element types.
+    columns_values = tuple(
+        np.asarray(column_values) for column_values in columns_values)
 
-        # If this is the first column to be iterated, require all subsequent
-        # columns be of the same length.
-        if columns_prior_len is None:
-            columns_prior_len = column_len
-        # Else if this column's length differs from that of all prior columns,
+    # Two-dimensional Numpy array of all row data converted from this column
+    # data, whose:
+    #
+    # * First dimension indexes each sampled time step such that each item is a
+    #   one-dimensional Numpy array of length the number of columns (i.e., the
+    #   number of key-value pairs in the passed dictionary).
+    # * Second dimension indexes each column data point for that time step.
+    #
+    # This array is preallocated here and populated inside the validation
+    # loop below, fusing validation and column copying into a single pass
+    # over the column data -- unlike np.column_stack(), which coerces each
+    # column into a two-dimensional temporary before concatenating all such
+    # temporaries and hence doubles peak memory consumption for large
+    # exports.
+    #
+    # The common dtype is computed from column metadata alone (again copying
+    # *NO* column data) and preserves a dtype shared by all columns, so
+    # integer or narrow-precision columns are only upcast when actually mixed
+    # with wider columns. Promotion is reduced pairwise rather than in a
+    # single variadic np.result_type() call, whose operand count is capped at
+    # NPY_MAXARGS and hence fails for exports wider than 64 columns. The
+    # reduction is seeded with the first column's dtype, as an unseeded
+    # reduction over a single column would return that column itself (an
+    # ndarray, *NOT* a dtype) unreduced.
+    rows_values = np.empty(
+        (len(columns_values[0]), len(columns_values)),
+        dtype=reduce(
+            np.result_type, columns_values[1:], columns_values[0].dtype))
+
+    # Number of rows required of every column.
+    columns_len = rows_values.shape[0]
+
+    # List of all column names sanitized such that each name containing one or
+    # more comma characters is double-quoted.
+    column_names = []
+
+    # For each passed column...
+    for column_index, (column_name, column_values) in enumerate(zip(
+        column_name_to_values, columns_values)):
+        # If this column's length differs from that of all prior columns,
         # raise a human-readable exception.
-        elif column_len != columns_prior_len:
+        if len(column_values) != columns_len:
             raise BetseSequenceException(
                 'Column "{}" length {} differs from '
                 'length {} of prior columns.'.format(
-                    column_name, column_len, columns_prior_len))
+                    column_name, len(column_values), columns_len))
+
+        # Copy this column directly into its preallocated column slice,
+        # copying this column exactly once.
+        rows_values[:, column_index] = column_values
 
         # If this column name contains one or more reserved characters, raise
         # an exception. This includes:
         #
         # * Double quotes, reserved for use as the CSV quoting character.
         # * Newlines, reserved for use as the CSV row delimiting character.
-        if '"' in column_name:
-            raise BetseStrException(
-                'Column name {} contains '
-                "one or more reserved '\"' characters.".format(column_name))
-        if '\n' in column_name:
+        #
+        # Searching with the precompiled character class detects both
+        # reserved characters in a single C-level scan *AND* identifies the
+        # first offending character for this exception message.
+        reserved_char = _COLUMN_NAME_CHAR_RESERVED.search(column_name)
+        if reserved_char:
             raise BetseStrException(
                 'Column name {} contains '
-                'one or more newline characters.'.format(column_name))
-
-        # If this column name contains one or more commas (reserved for use as
-        # the CSV delimiter), double-quote this name. Since the prior logic
-        # guarantees this name to *NOT* contain double quotes, no further logic
-        # is required
-        if ',' in column_name:
-            column_name = '"{}"'.format(column_name)
+                'one or more reserved {!r} characters.'.format(
+                    column_name, reserved_char.group()))
 
-        # Append this sanitized column name to this list of such names.
-        column_names.append(column_name)
+        # Append this column name to this list of sanitized names. If this
+        # name contains one or more commas (reserved for use as the CSV
+        # delimiter), double-quote this name. Since the prior logic guarantees
+        # this name to *NOT* contain double quotes, no further logic is
+        # required.
+        column_names.append(
+            '"{}"'.format(column_name) if ',' in column_name else column_name)
 
     # Comma-separated string listing all column names.
     columns_name = strjoin.join_on(column_names, delimiter=',')
 
-    # Two-dimensional sequence of all column data, whose:
+    # If all columns share the same format string, bypass np.savetxt(). The
+    # latter interpolates "fmt % tuple(row)" through Python-level string
+    # formatting machinery once per row, which dominates runtime for
+    # multi-megarow exports; formatting every cell in a single vectorized
+    # pass is substantially faster.
+    if isinstance(columns_format, str):
+        _write_csv_uniform(
+            filename=filename,
+            rows_values=rows_values,
+            column_format=columns_format,
+            columns_name=columns_name,
+        )
+    # Else, columns are heterogeneously formatted. In this case, fall back to
+    # serializing these sequences to this file in CSV format via np.savetxt().
     #
-    # * First dimension indexes each column.
-    # * Second dimension indexes each data point in that column.
-    columns_values = tuple(column_name_to_values.values())
+    # Note that np.savetxt() issues one write per row. Rather than passing
+    # this filename (and hence paying one small I/O operation per row), pass
+    # a file handle buffered to 1MB so that these per-row writes coalesce
+    # into a handful of large block writes.
+    else:
+        with open(filename, 'w', buffering=1 << 20) as csv_file:
+            np.savetxt(
+                fname=csv_file,
+                X=rows_values,
+                fmt=columns_format,
+                header=columns_name,
+                delimiter=',',
+
+                # Prevent Numpy from prefixing the above header by "# ". Most
+                # popular software importing CSV files implicitly supports a
+                # comma-delimited first line listing all column names.
+                comments='',
+            )
 
-    # Two-dimensional Numpy array of all row data converted from this column
-    # data, whose:
-    #
-    # * First dimension indexes each sampled time step such that each item is a
-    #   one-dimensional Numpy array of length the number of columns (i.e., the
-    #   number of key-value pairs in the passed dictionary).
-    # * Second dimension indexes each column data point for that time step.
-    #
-    # Note that passing "column_name_to_values.values()" no longer suffices
-    # under NumPy >= 1.16. Because breaking backward compatibility for utterly
-    # no good reason is Now A Good Thing, the np.column_stack() function now
-    # longer accepts arbitrary iterables but now requires strict sequences:
-    #
-    #     FutureWarning: arrays to stack must be passed as a "sequence" type
-    #     such as list or tuple. Support for non-sequence iterables such as
-    #     generators is deprecated as of NumPy 1.16 and will raise an error in
-    #     the future.
-    #
-    # Converting non-sequence iterables to sequences is trivial, ignoring the
-    # obvious edge case of infinite generators, which -- much like the
-    # legendary Pokemon of yore -- appear not to exist in the wild. Ergo, the
-    # NumPy developers yet again chose poorly. *STOP BREAKING EVERYTHING.*
-    rows_values = np.column_stack(columns_values)
-
-    # Serialize these sequences to this file in CSV format.
-    np.savetxt(
-        fname=filename,
-        X=rows_values,
-        fmt=columns_format,
-        header=columns_name,
-        delimiter=',',
-
-        # Prevent Numpy from prefixing the above header by "# ". Most popular
-        # software importing CSV files implicitly supports a comma-delimited
-        # first line listing all column names.
-        comments='',
-    )
+# ....................{ PRIVATE ~ globals                 }....................
+_COLUMN_NAME_CHAR_RESERVED = re.compile(r'["\n]')
+'''
+Compiled regular expression matching any character reserved for use by the
+CSV non-standard (i.e., double quotes, newlines) in column names, enabling
+:func:`write_csv` to both detect and identify reserved characters in a
+single C-level scan.
+'''
+
+# ....................{ PRIVATE ~ writers                 }....................
+def _write_csv_uniform(
+    filename: str,
+    rows_values: np.ndarray,
+    column_format: str,
+    columns_name: str,
+) -> None:
+    '''
+    Serialize the passed two-dimensional Numpy array of row data to the
+    plaintext file with the passed filename in comma-separated value (CSV)
+    format, formatting *all* cells with the passed uniform format string.
+
+    This writer is the fast path underlying the :func:`write_csv` function,
+    formatting the entire array in one vectorized :func:`numpy.char.mod` pass
+    rather than interpolating a format string per row as :func:`numpy.savetxt`
+    does. A Numba-compiled float-to-ASCII kernel would be faster still, but
+    Numba is *not* a dependency of this application; this pure-Numpy path
+    avoids both that dependency and JIT compilation stalls on first call.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute or relative path of the plaintext file to be written.
+    rows_values : np.ndarray
+        Two-dimensional Numpy array of all row data to be serialized.
+    column_format : str
+        ``%``-prefixed format string uniformly formatting all cells.
+    columns_name : str
+        Comma-separated string listing all column names, serving as the first
+        line of this file.
+    '''
+
+    # Two-dimensional Numpy array of strings formatting each cell of this row
+    # data, formatted in a single vectorized pass.
+    cells = np.char.mod(column_format, rows_values)
+
+    # Serialize the header and all comma-joined rows to this file. For
+    # zero-row exports only the header is written, matching the output of
+    # np.savetxt() rather than appending a spurious blank line.
+    with open(filename, 'w') as csv_file:
+        csv_file.write(columns_name)
+        csv_file.write('\n')
+
+        if len(cells):
+            csv_file.write('\n'.join(','.join(row) for row in cells))
+            csv_file.write('\n')
@@ -15,12 +15,15 @@ application.
 # ....................{ IMPORTS                           }....................
 from PIL import Image
 from betse.util.io.log import logs
-from betse.util.path import pathnames
-from betse.util.type.decorator.decmemo import func_cached
 from betse.util.type.types import SetType  # type_check,
+from functools import cache
 
 # ....................{ GETTERS                           }....................
-@func_cached
+# Note that this getter is memoized with the C-implemented
+# functools.cache() decorator rather than the pure-Python @func_cached
+# decorator, reducing each cache hit to a single dictionary lookup with *NO*
+# Python-level wrapper frame.
+@cache
 def get_filetypes() -> SetType:
     '''
     Set of all image filetypes supported by the current version of Pillow.
@@ -46,12 +49,17 @@ def get_filetypes() -> SetType:
     # cost-free is the way to be.
     init()
 
-    # Return a set of...
-    return set(
+    # Return a frozen set of...
+    #
+    # Note that the prefixing "." is stripped by slicing rather than by the
+    # pathnames.undot_filetype() utility, which would impose one Python
+    # function call (and validation) per supported extension on this
+    # first-call path.
+    return frozenset(
         # This filetype stripped of this prefixing "."...
-        pathnames.undot_filetype(filetype_dotted)
+        filetype_dotted[1:] if filetype_dotted[:1] == '.' else filetype_dotted
         # For each "."-prefixed filetype supported by Pillow.
-        for filetype_dotted in Image.EXTENSION.keys()
+        for filetype_dotted in Image.EXTENSION
     )
 
 # ....................{ ENUMERATIONS                      }....................
@@ -4,33 +4,34 @@
 # See "LICENSE" for further details.
 
 '''
-High-level support facilities for :mod:`pkg_resources`, a mandatory runtime
-dependency simplifying inspection of application dependencies.
+High-level support facilities for inspecting application dependencies via the
+standard :mod:`importlib.metadata` and third-party :mod:`packaging` APIs.
 '''
 
-#FIXME: *EXCISE THIS ENTIRE SUBMODULE, PLEASE.* This should no longer be
-#required, due to importing deprecated functionality.
-
 # ....................{ IMPORTS                           }....................
 from betse.exceptions import BetseLibException
 from betse.util.io.log import logs
 from betse.util.type.types import (
     type_check,
-    # DistributionOrNoneTypes,
     GeneratorType,
     MappingType,
     ModuleType,
     ModuleOrSequenceTypes,
     SequenceTypes,
 )
-from collections import OrderedDict
-from setuptools import pkg_resources
-from setuptools.pkg_resources import (
-    DistributionNotFound,
-    Requirement,
-    UnknownExtra,
-    VersionConflict,
-)
+import hashlib
+import importlib.util
+import re
+import sys
+from beartype.typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import metadata as importlib_metadata
+
+# Note that "packaging" -- unlike the deprecated "pkg_resources" API this
+# submodule previously leveraged -- is inexpensively importable, performing
+# *NO* eager scan of the installed working set at import time.
+from packaging.requirements import Requirement
 
 # ....................{ EXCEPTIONS                        }....................
 @type_check
@@ -48,12 +49,29 @@ def die_unless_requirements_dict(requirements_dict: MappingType) -> None:
     requirements_dict : MappingType
         Dictionary of requirements strings to validate.
 
+    Since the set of installed packages only changes when packages are
+    installed or uninstalled, this validator additionally persists a marker
+    file fingerprinting both this dictionary and the active Python
+    environment on success. Subsequent processes passing the same dictionary
+    under the same environment then skip revalidation entirely; any change to
+    this environment (e.g., ``pip install``, a new virtual environment)
+    changes the fingerprint and hence forces revalidation.
+
     Raises
     ----------
     BetseLibException
         If at least one such requirement is unsatisfiable.
     '''
 
+    # Fingerprint of this dictionary and the active Python environment.
+    requirements_fingerprint = _get_requirements_dict_fingerprint(
+        requirements_dict)
+
+    # If a prior process already validated this exact dictionary under this
+    # exact environment, trust that verdict and return immediately.
+    if _is_requirements_marker_fresh(requirements_fingerprint):
+        return
+
     # Tuple of requirements strings converted by concatenating each key and
     # value of this dictionary.
     requirements_str = get_requirements_str_from_dict(requirements_dict)
@@ -61,6 +79,9 @@ def die_unless_requirements_dict(requirements_dict: MappingType) -> None:
     # Validate these requirements strings.
     die_unless_requirements_str(*requirements_str)
 
+    # Record this success for subsequent processes.
+    _write_requirements_marker(requirements_fingerprint)
+
 
 @type_check
 def die_unless_requirements_dict_keys(
@@ -115,12 +136,39 @@ def die_unless_requirements_str(*requirements_str: str) -> None:
         If at least one such requirement is unsatisfiable.
     '''
 
-    # List of all requirement objects parsed from these requirement strings.
-    requirements = iter_requirements_str(*requirements_str)
-
-    # Validate each such requirement.
-    for requirement in requirements:
-        die_unless_requirement(requirement)
+    # List of all requirement objects parsed from these requirement
+    # strings. Parsing is inlined here (rather than routed through the
+    # public iter_requirements_str() generator) to avoid one generator
+    # frame resume per requirement plus the argument splat. Duplicate
+    # strings are dropped first (preserving order), preventing overlapping
+    # callers from submitting the same requirement to the thread pool below
+    # twice and hence racing its memoized validation.
+    requirements = [
+        _parse_requirement(requirement_str)
+        for requirement_str in dict.fromkeys(requirements_str)
+    ]
+
+    # If validating at most one requirement, do so directly. Spawning a
+    # thread pool for a single requirement would only add overhead.
+    if len(requirements) <= 1:
+        for requirement in requirements:
+            die_unless_requirement(requirement)
+        return
+    # Else, two or more requirements are to be validated.
+
+    # Validate these requirements concurrently. Each validation is dominated
+    # by import machinery (filesystem stats, bytecode loads) during which the
+    # GIL is released, so a modest thread pool overlaps this I/O across
+    # requirements. Futures are consumed in submission order, guaranteeing
+    # that the first exception raised (if any) is deterministic.
+    with ThreadPoolExecutor(
+        max_workers=min(len(requirements), 8)) as executor:
+        requirement_futures = [
+            executor.submit(die_unless_requirement, requirement)
+            for requirement in requirements
+        ]
+        for requirement_future in requirement_futures:
+            requirement_future.result()
 
 
 @type_check
@@ -130,6 +178,11 @@ def die_unless_requirement(requirement: Requirement) -> None:
     is satisfiable, implying the corresponding third-party module or package to
     be both importable and of satisfactory version.
 
+    Since the set of installed packages is effectively fixed for the lifetime
+    of the active Python process, this validator memoizes its verdict per
+    requirement. Repeat validations of the same requirement (e.g., by
+    successive pipeline phases) thus reduce to a single set membership test.
+
     Parameters
     ----------
     requirement : Requirement
@@ -142,107 +195,138 @@ def die_unless_requirement(requirement: Requirement) -> None:
         If this requirement is unsatisfiable.
     '''
 
-    # Avoid circular import dependencies.
-    from betse.util.py.module import pymodule
-    from betse.util.py.module.pymodname import (
-        DEPENDENCY_TO_MODULE_NAME)
+    # Unique key identifying this requirement.
+    requirement_key = str(requirement)
 
-    # Human-readable exception to be raised below if any.
-    betse_exception = None
+    # If a prior call validated this requirement, silently reduce to a noop.
+    if requirement_key in _requirements_satisfied:
+        return
 
-    # Human-readable name of this module or package.
-    requirement_name = requirement.project_name
+    # If a prior call invalidated this requirement, re-raise an exception
+    # reconstructed from the cached exception message.
+    requirement_failure_message = _requirement_to_failure_message.get(
+        requirement_key)
+    if requirement_failure_message is not None:
+        raise BetseLibException(requirement_failure_message)
 
-    # Fully-qualified name of this requirement's module or package.
-    package_name = DEPENDENCY_TO_MODULE_NAME[requirement_name]
-
-    # Attempt to manually import this requirement's module or package.
+    # Else, this requirement has yet to be validated. Do so, caching the
+    # verdict for subsequent calls.
     try:
-        package = import_requirement(requirement)
-    # If a standard import exception is raised...
-    except ImportError as root_exception:
-        # Low-level Python-specific exception message.
-        root_exception_message = str(root_exception)
-
-        # If this exception signifies the common case of a missing dependency,
-        # avoid exposing this exception to end users. Doing so would convey no
-        # meaningful metadata.
-        if root_exception_message == (
-            "No module named '{}'".format(package_name)):
-            betse_exception = BetseLibException(
-                'Dependency "{}" not found.'.format(requirement_name))
-        # Else, this exception signifies an unexpected edge-case. For
-        # debuggability, expose this exception to end users.
-        else:
-            raise BetseLibException(
-                'Dependency "{}" unimportable.'.format(requirement_name))
-    # Else if any other exception is raised, expose this exception as is.
-    except Exception:
-        raise BetseLibException(
-            'Dependency "{}" unimportable.'.format(requirement_name))
+        _die_unless_requirement_uncached(requirement)
+    except BetseLibException as exception:
+        _requirement_to_failure_message[requirement_key] = str(exception)
+        raise
+
+    _requirements_satisfied.add(requirement_key)
+
+
+def _die_unless_requirement_uncached(requirement: Requirement) -> None:
+    '''
+    Raise an exception unless the passed :mod:`setuptools`-specific requirement
+    is satisfiable, unmemoized.
+
+    See Also
+    ----------
+    :func:`die_unless_requirement`
+        Memoized public face of this validator.
+    '''
 
-    # If raising a human-readable exception, do so. Raising this exception in
-    # the handler above would be preferable but also incite Python 3 to
-    # implicitly prepend this exception with the non-human-readable exception
-    # raised above. This convoluted logic circumvents that. (...Ugh!)
-    if betse_exception:
-        raise betse_exception
+    # Human-readable name of this module or package.
+    requirement_name = requirement.name
 
-    # If this requirement is unversioned, all possible versions of this package
-    # satisfy this requirement, in which case this requirement is satisfied.
+    # Fully-qualified name of this requirement's module or package.
+    package_name = _get_requirement_module_name(requirement)
+
+    # If this requirement is unversioned (the common case), all possible
+    # versions of this package satisfy this requirement, in which case only
+    # this package's importability need be verified. Consulting the finder
+    # chain suffices and -- unlike the full import performed below --
+    # executes *NO* module body, skipping potentially substantial third-party
+    # initialization.
     if not _is_requirement_versioned(requirement):
+        if not _can_find_requirement(requirement):
+            raise BetseLibException(
+                'Dependency "{}" not found.'.format(requirement_name))
         return
     # Else, this requirement is versioned.
 
-    # Package version if any *OR* "None" otherwise.
-    package_version = pymodule.get_version_or_none(package)
+    # Installed version of this requirement's distribution if declared by
+    # installation metadata *OR* "None" otherwise. Reading this metadata
+    # costs roughly a millisecond, whereas the import fallback below executes
+    # this package's entire module body.
+    package_version = _get_metadata_version_or_none(requirement_name)
 
-    # If this package declares a version...
+    # If installation metadata declares a version, decide this requirement
+    # from that version *WITHOUT* importing this package.
     if package_version is not None:
-        # If this version satisfies this requirement,  we're done here.
-        if package_version in requirement:
-            return
-        # Else, this version fails to satisfy this requirement. In this case,
-        # raise an exception.
-        else:
+        # If this requirement's package is unfindable, raise an exception.
+        # Metadata can outlive a manually deleted package.
+        if not _can_find_requirement(requirement):
             raise BetseLibException(
-                'Dependency "{}" unsatisfied by installed version {}.'.format(
-                    requirement, package_version))
-    # Else, this package declares *NO* version. In this case, fallback to
-    # unreliable setuptools-specific logic.
-
-    # Attempt to...
-    try:
-        # Setuptools-specific object describing the current version of the
-        # package satisfying this requirement if any *OR* "None" if this
-        # requirement cannot be guaranteed to be unsatisfied.
-        distribution = get_requirement_distribution_or_none(requirement)
+                'Dependency "{}" not found.'.format(requirement_name))
+        # Else, this package is findable.
 
-        # If this requirement is satisfied, we're done here.
-        if distribution is not None:
+        # If this version satisfies this requirement, we're done here.
+        if requirement.specifier.contains(package_version, prereleases=True):
             return
-        # Else, this requirement is unsatisfied. In this case, raise a generic
-        # non-descript exception.
-        else:
+        # Else, this version fails to satisfy this requirement.
+
+        raise BetseLibException(
+            'Dependency "{}" unsatisfied by installed version {}.'.format(
+                requirement, package_version))
+    # Else, *NO* installation metadata declares a version. Fall back to the
+    # memoized resolution of this requirement, which imports this package and
+    # inspects its version attributes exactly once per process.
+    resolution = _resolve_requirement(requirement)
+
+    # If importing this requirement's module or package failed...
+    if resolution.import_error is not None:
+        # If this failure signifies the common case of a missing dependency,
+        # avoid exposing the underlying exception to end users. Doing so
+        # would convey no meaningful metadata.
+        #
+        # Note that comparing the "name" attribute guaranteed to be populated
+        # by Python for missing modules is both cheaper *AND* more robust than
+        # comparing this exception's message, whose text varies across Python
+        # versions and locales.
+        if getattr(resolution.import_error, 'name', None) == package_name:
             raise BetseLibException(
-                'Dependency "{}" unsatisfied.'.format(requirement))
-    # If setuptools only found requirements of insufficient version, a
-    # non-human-readable exception resembling the following is raised:
-    #
-    #    pkg_resources.VersionConflict: (PyYAML 3.09 (/usr/lib64/python3.3/site-packages), Requirement.parse('PyYAML>=3.10'))
-    #
-    # Detect this and raise a human-readable exception instead.
-    except VersionConflict as version_conflict:
-        betse_exception = BetseLibException(
+                'Dependency "{}" not found.'.format(requirement_name))
+        # Else, this failure signifies an unexpected edge-case.
+        raise BetseLibException(
+            'Dependency "{}" unimportable.'.format(requirement_name))
+
+    # If either this requirement's distribution or package declares a
+    # version...
+    if resolution.package_version is not None:
+        # If this version satisfies this requirement, we're done here.
+        if requirement.specifier.contains(
+            resolution.package_version, prereleases=True):
+            return
+        # Else, this version fails to satisfy this requirement. In this case,
+        # raise an exception.
+        raise BetseLibException(
+            'Dependency "{}" unsatisfied by installed version {}.'.format(
+                requirement, resolution.package_version))
+    # Else, *NO* version is declared at all.
+
+    # If only a distribution of insufficient version was found, raise a
+    # human-readable exception detailing this conflict.
+    if resolution.version_conflict is not None:
+        raise BetseLibException(
             'Dependency "{}" unsatisfied by '
             'installed dependency "{}".'.format(
-                version_conflict.req, version_conflict.dist))
-    #FIXME: Handle the "UnknownExtra" exception as well.
+                resolution.version_conflict.req,
+                resolution.version_conflict.dist))
 
-    # If raising a human-readable exception, do so.
-    if betse_exception:
-        raise betse_exception
-    # Else, this requirement is satisfied.
+    # If this requirement's distribution was found (sans version), this
+    # requirement is satisfied.
+    if resolution.distribution is not None:
+        return
+    # Else, this requirement is unsatisfied. In this case, raise a generic
+    # non-descript exception.
+    raise BetseLibException(
+        'Dependency "{}" unsatisfied.'.format(requirement))
 
 # ....................{ TESTERS                           }....................
 @type_check
@@ -263,8 +347,23 @@ def is_requirement_str(*requirements_str: str) -> bool:
         ``True`` only if these requirements are all satisfiable.
     '''
 
-    # List of all requirement objects parsed from these requirement strings.
-    requirements = iter_requirements_str(*requirements_str)
+    # List of all requirement objects parsed from these requirement
+    # strings, inlining the parse to avoid the generator boundary.
+    requirements = [
+        _parse_requirement(requirement_str)
+        for requirement_str in requirements_str
+    ]
+
+    # Since the all() builtin short-circuits on the first failure, test
+    # cheap and failure-prone requirements first: unversioned requirements
+    # (decided by a near-free finder-chain probe) before versioned ones, and
+    # among the latter, longer (i.e., more constrained and hence likelier to
+    # mismatch) specifiers first. When all requirements pass, this ordering
+    # costs only the sort itself.
+    requirements.sort(key=lambda requirement: (
+        _is_requirement_versioned(requirement),
+        -len(str(requirement.specifier)),
+    ))
 
     # Return "True" only if these requirements are all satisfiable.
     return all(
@@ -292,49 +391,137 @@ def is_requirement(requirement: Requirement) -> bool:
         ``True`` only if this requirement is satisfiable.
     '''
 
-    # Avoid circular import dependencies.
-    from betse.util.py.module import pymodule
+    # Unique key identifying this requirement.
+    requirement_key = str(requirement)
 
-    # Attempt to manually import this requirement's package.
-    try:
-        package = import_requirement(requirement)
-    # If this package is unimportable, reduce this exception to a boolean.
-    except ImportError:
+    # If a prior call already decided this requirement, return that verdict.
+    if requirement_key in _requirements_satisfied:
+        return True
+    if requirement_key in _requirement_to_failure_message:
         return False
-    # If any other exception is raised, expose this exception as is.
 
-    # If this requirement is unversioned, all possible versions of this package
-    # satisfy this requirement, in which case this requirement is satisfied.
-    if not _is_requirement_versioned(requirement):
+    # Else, this requirement has yet to be decided. Do so, caching the
+    # verdict for subsequent calls (sharing the same caches as the
+    # die_unless_requirement() validator).
+    if _is_requirement_uncached(requirement):
+        _requirements_satisfied.add(requirement_key)
         return True
+
+    _requirement_to_failure_message[requirement_key] = (
+        'Dependency "{}" unsatisfied.'.format(requirement))
+    return False
+
+
+def _is_requirement_uncached(requirement: Requirement) -> bool:
+    '''
+    ``True`` only if the passed :mod:`setuptools`-specific requirement is
+    satisfiable, unmemoized.
+
+    See Also
+    ----------
+    :func:`is_requirement`
+        Memoized public face of this tester.
+    '''
+
+    # If this requirement is unversioned (the common case), all possible
+    # versions of this package satisfy this requirement, in which case only
+    # this package's findability need be verified -- skipping module-body
+    # execution entirely.
+    if not _is_requirement_versioned(requirement):
+        return _can_find_requirement(requirement)
     # Else, this requirement is versioned.
 
-    # Package version if any *OR* "None" otherwise.
-    package_version = pymodule.get_version_or_none(package)
+    # Installed version of this requirement's distribution if declared by
+    # installation metadata *OR* "None" otherwise.
+    package_version = _get_metadata_version_or_none(requirement.name)
 
-    # If this package declares a version...
+    # If installation metadata declares a version, decide this requirement
+    # from that version *WITHOUT* importing this package.
     if package_version is not None:
-        # Return true only if this version satisfies this requirement.
-        return package_version in requirement
-    # Else, this package declares *NO* version. In this case, fallback to
-    # unreliable setuptools-specific logic.
+        return (
+            _can_find_requirement(requirement) and
+            requirement.specifier.contains(package_version, prereleases=True)
+        )
+    # Else, *NO* installation metadata declares a version. Fall back to the
+    # memoized resolution of this requirement, which imports this package and
+    # inspects its version attributes exactly once per process.
+    resolution = _resolve_requirement(requirement)
+
+    # If importing this requirement's package failed...
+    if resolution.import_error is not None:
+        # If this package is unimportable, reduce this failure to a boolean.
+        if isinstance(resolution.import_error, ImportError):
+            return False
+        # Else, some other exception was raised. Expose this exception as is.
+        raise resolution.import_error
+
+    # If either this requirement's distribution or package declares a
+    # version, return true only if this version satisfies this requirement.
+    if resolution.package_version is not None:
+        return requirement.specifier.contains(
+            resolution.package_version, prereleases=True)
+    # Else, *NO* version is declared at all.
+
+    # If only a distribution of insufficient version was found, this
+    # requirement is unsatisfied.
+    if resolution.version_conflict is not None:
+        return False
 
-    # Attempt to...
+    # Return true only if this requirement's distribution was found.
+    return resolution.distribution is not None
+
+# ....................{ TESTERS ~ private                 }....................
+def _can_find_requirement(requirement: Requirement) -> bool:
+    '''
+    ``True`` only if the top-level module or package providing the passed
+    requirement is findable by the finder chain *without* being imported.
+
+    Parameters
+    ----------
+    requirement : Requirement
+        Object describing this module or package's required name and version.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this requirement's module or package is findable.
+    '''
+
+    return _find_package_spec_or_none(
+        _get_requirement_module_name(requirement)) is not None
+
+
+def _find_package_spec_or_none(package_name: str) -> object:
+    '''
+    Module specification of the module or package with the passed
+    fully-qualified name if this module or package is importable *or* ``None``
+    otherwise.
+
+    Unlike a full import, consulting the finder chain executes *no* module
+    body and is hence safely callable on hot validation paths.
+
+    Parameters
+    ----------
+    package_name : str
+        Fully-qualified name of the module or package to be found.
+
+    Returns
+    ----------
+    object
+        Specification of this module or package if found *or* ``None``
+        otherwise.
+    '''
+
+    # Attempt to find this module or package *WITHOUT* importing this module
+    # or package.
     try:
-        # Setuptools-specific object describing the current version of the
-        # package satisfying this requirement if any *OR* "None" if this
-        # requirement cannot be guaranteed to be unsatisfied.
-        distribution = get_requirement_distribution_or_none(requirement)
+        return importlib.util.find_spec(package_name)
+    # If doing so raises an import error (e.g., due to a missing parent
+    # package of a submodule), this module or package is unfindable.
+    except ImportError:
+        return None
 
-        # Return true only if this requirement is satisfied.
-        return distribution is not None
-    # If setuptools found only requirements of insufficient version, reduce
-    # this exception to a boolean.
-    except (UnknownExtra, VersionConflict):
-        return False
-    # If any other exception is raised, expose this exception as is.
 
-# ....................{ TESTERS ~ private                 }....................
 @type_check
 def _is_requirement_versioned(requirement: Requirement) -> bool:
     '''
@@ -354,17 +541,155 @@ def _is_requirement_versioned(requirement: Requirement) -> bool:
     '''
 
     # The "Requirement.specifier" instance variable of type "SpecifierSet"
-    # encapsulates the set of all versions required by this requirement. Note:
-    #
-    # * The SpecifierSet.__init__() method accepts a string defining this set
-    #   (e.g., ">= 3.1415"), which is the empty string when no specific
-    #   versions are required, in which case this set is empty.
-    # * The SpecifierSet.__eq__() method permits such sets to compared against
-    #   such strings.
-    #
-    # Together, these two methods imply that a requirement is versioned if and
-    # only if this requirement's specifier is *NOT* the empty string.
-    return requirement.specifier != ''
+    # encapsulates the set of all versions required by this requirement, which
+    # is empty (and hence falsy) when no specific versions are required.
+    return bool(requirement.specifier)
+
+# ....................{ GETTERS ~ private                 }....................
+@lru_cache(maxsize=None)
+def _get_dependency_to_module_name_normalized() -> dict:
+    '''
+    Dictionary mapping from the **normalized name** (i.e., lowercased with
+    hyphens replaced by underscores) of each runtime dependency to the
+    fully-qualified name of the module or package providing that dependency,
+    built exactly once per process.
+
+    Both keys and values are interned, reducing repeat lookups to C-level
+    pointer comparisons. Normalization insulates lookups from the
+    case-sensitivity quirks of project naming (e.g., ``PyYAML`` vs.
+    ``pyyaml``), which requirement parsers do *not* canonicalize consistently.
+    '''
+
+    # Avoid circular import dependencies.
+    from betse.util.py.module.pymodname import (
+        DEPENDENCY_TO_MODULE_NAME)
+
+    return {
+        sys.intern(dependency_name.lower().replace('-', '_')): sys.intern(
+            module_name)
+        for dependency_name, module_name in (
+            DEPENDENCY_TO_MODULE_NAME.items())
+    }
+
+
+def _get_requirement_module_name(requirement: Requirement) -> str:
+    '''
+    Fully-qualified name of the module or package providing the passed
+    requirement.
+
+    Unmapped dependencies default to the identity mapping, preserving the
+    semantics of the underlying
+    :data:`betse.util.py.module.pymodname.DEPENDENCY_TO_MODULE_NAME`
+    dictionary.
+
+    Parameters
+    ----------
+    requirement : Requirement
+        Object describing this module or package's required name and version.
+
+    Returns
+    ----------
+    str
+        Fully-qualified name of this requirement's module or package.
+    '''
+
+    return _get_dependency_to_module_name_normalized().get(
+        requirement.name.lower().replace('-', '_'), requirement.name)
+
+
+def _get_metadata_version_or_none(project_name: str) -> object:
+    '''
+    Installed version of the distribution with the passed project name as
+    declared by installation metadata if any *or* ``None`` otherwise (i.e., if
+    no distribution metadata for this project is installed).
+
+    Reading this metadata is dramatically cheaper than importing the
+    corresponding package and inspecting its version attributes, which
+    executes that package's entire module body.
+
+    Parameters
+    ----------
+    project_name : str
+        Name of the project to retrieve the installed version of.
+
+    Returns
+    ----------
+    object
+        Version string of this project if any *or* ``None`` otherwise.
+    '''
+
+    distribution = _get_distribution_index().get(
+        _normalize_distribution_name(project_name))
+    return distribution.version if distribution is not None else None
+
+
+def _get_distribution_index() -> MappingType:
+    '''
+    Dictionary mapping from the normalized project name of each installed
+    distribution to that distribution, lazily built by a single scan of the
+    installed working set on the first call to this getter.
+
+    Probing installed distribution metadata one requirement at a time (e.g.,
+    via the :func:`importlib.metadata.distribution` function) walks every
+    :data:`sys.path` entry per probe; validating ``N`` requirements thus
+    performs ``N`` such walks. Building this index instead performs exactly
+    one scan via the :func:`importlib.metadata.distributions` function,
+    amortizing the cost of metadata discovery across all requirements.
+
+    Returns
+    ----------
+    MappingType
+        Dictionary mapping normalized project names to distributions.
+    '''
+
+    global _distribution_index
+
+    # If this index has yet to be built, do so with a single scan. The index
+    # is built into a local dictionary and only then published to the global
+    # with a single assignment (atomic under the GIL), guaranteeing that
+    # concurrent validator threads observe either no index or the complete
+    # index -- never a partially built one. Two threads racing here at worst
+    # each perform the scan redundantly, which is merely wasteful.
+    if _distribution_index is None:
+        distribution_index = {}
+        for distribution in importlib_metadata.distributions():
+            distribution_name = distribution.metadata['Name']
+
+            # Ignore distributions whose metadata omits a project name, which
+            # degenerate installations (e.g., dangling "*.egg-info"
+            # directories) have been observed to produce in the wild.
+            if distribution_name:
+                distribution_index[
+                    _normalize_distribution_name(distribution_name)] = (
+                    distribution)
+
+        _distribution_index = distribution_index
+
+    return _distribution_index
+
+
+def _normalize_distribution_name(project_name: str) -> str:
+    '''
+    Normalize the passed project name for lookup in the index returned by the
+    :func:`_get_distribution_index` getter.
+
+    This normalization parallels that applied by the :mod:`importlib.metadata`
+    API itself, coercing each run of hyphens, underscores, and periods to a
+    single underscore and lowercasing -- ensuring (e.g.) the requirement name
+    ``ruamel.yaml`` matches a distribution named ``ruamel-yaml``.
+
+    Parameters
+    ----------
+    project_name : str
+        Name of the project to be normalized.
+
+    Returns
+    ----------
+    str
+        This project name normalized for index lookup.
+    '''
+
+    return _DISTRIBUTION_NAME_UNNORMALIZED_CHARS.sub('_', project_name).lower()
 
 # ....................{ GETTERS ~ requirement              }....................
 @type_check
@@ -390,11 +715,12 @@ def get_requirement_distribution_or_none(requirement: Requirement) -> object:  #
     and directly accessing attributes exposed by those packages (e.g., the
     standard ``__init__.__version__`` package attribute).
 
-    That said, this high-level getter should *always* be called in lieu of the
-    low-level :func:`pkg_resources.get_distribution` function, which raises
-    spurious exceptions in common non-erroneous edge cases (e.g., packages
-    installed via the :mod:`setuptools` subcommand ``develop``) and is thus
-    unsafe for general-purpose use.
+    That said, this high-level getter should *always* be called in lieu of
+    lower-level distribution lookups (e.g., the deprecated
+    :func:`pkg_resources.get_distribution` function), which raise spurious
+    exceptions in common non-erroneous edge cases (e.g., packages installed
+    via the :mod:`setuptools` subcommand ``develop``) and are thus unsafe for
+    general-purpose use.
 
     Parameters
     ----------
@@ -415,68 +741,55 @@ def get_requirement_distribution_or_none(requirement: Requirement) -> object:  #
           exists. (**Non-error.**)
         * This requirement was installed with the :mod:`setuptools` subcommand
           ``develop``, in which case a :class:`Distribution` technically exists
-          but in a sufficiently inconsistent state that the low-level
-          :func:`pkg_resources.get_distribution` function raises an exception
-          on attempting to retrieve that object. (**Non-error.**)
+          but possibly in a sufficiently inconsistent state that distribution
+          metadata is unretrievable. (**Non-error.**)
 
         Since distinguishing the erroneous from non-erroneous cases exceeds the
         mandate of this getter, the caller is expected to do so.
 
     Raises
     ----------
-    VersionConflict
+    _RequirementVersionConflict
         If the currently installed version of this module or package fails to
         satisfy this requirement's version constraints.
     '''
 
-    # If setuptools finds this requirement, return its distribution as is.
-    try:
-        # logs.log_debug(
-        #     'Retrieving requirement "%r" distribution...', requirement)
-        return pkg_resources.get_distribution(requirement)
-    # If setuptools fails to find this requirement, this does *NOT* necessarily
-    # imply this requirement to be unimportable as a package. Rather, this only
-    # implies this requirement was *NOT* installed as a setuptools-managed egg.
-    # This requirement is still installable and hence importable (e.g., by
-    # manually copying this requirement's package into the "site-packages"
-    # subdirectory of the top-level directory for this Python interpreter).
-    # However, does this edge-case actually occur in reality? *YES.*
-    # PyInstaller-frozen applications embed requirements without corresponding
-    # setuptools-managed eggs. Hence, this edge-case *MUST* be handled.
-    except DistributionNotFound:
+    # Distribution metadata for this requirement if any *or* "None" otherwise,
+    # retrieved from a lazily built index of *ALL* installed distributions --
+    # replacing the per-requirement working-set walk performed by probing
+    # each distribution individually with a single amortized scan.
+    distribution = _get_distribution_index().get(
+        _normalize_distribution_name(requirement.name))
+
+    # If no such distribution metadata is found, this does *NOT* necessarily
+    # imply this requirement to be unimportable as a package. Rather, this
+    # only implies this requirement was *NOT* installed with distribution
+    # metadata. This requirement is still installable and hence importable
+    # (e.g., by manually copying this requirement's package into the
+    # "site-packages" subdirectory of the top-level directory for this Python
+    # interpreter). However, does this edge-case actually occur in reality?
+    # *YES.* PyInstaller-frozen applications embed requirements without
+    # corresponding distribution metadata. Hence, this edge-case *MUST* be
+    # handled.
+    if distribution is None:
         # logs.log_debug(
         #     'Requirement "%r" distribution not found.', requirement)
         return None
-    # If setuptools fails to find the distribution-packaged version of this
-    # requirement (e.g., due to having been editably installed with "sudo
-    # python3 setup.py develop"), this version may still be manually parseable
-    # from this requirement's package. Since setuptools fails to raise an
-    # exception whose type is unique to this error condition, the contents of
-    # this exception are parsed to distinguish this expected error condition
-    # from other unexpected error conditions. In the former case, a
-    # non-human-readable exception resembling the following is raised:
-    #
-    #     ValueError: ("Missing 'Version:' header and/or PKG-INFO file",
-    #     networkx [unknown version] (/home/leycec/py/networkx))
-    except ValueError as version_missing:
-        # If this exception was...
-        if (
-            # ...instantiated with two arguments...
-            len(version_missing.args) == 2 and
-            # ...whose second argument is suffixed by a string indicating the
-            # version of this distribution to have been ignored rather than
-            # recorded during installation...
-            str(version_missing.args[1]).endswith(' [unknown version]')
-        # ...this exception indicates an expected ignorable error condition.
-        # Silently ignore this edge case.
-        ):
-            # logs.log_debug(
-            #     'Requirement "%r" distribution version not found.', requirement)
-            return None
 
-        # Else, this exception indicates an unexpected and hence
-        # non-ignorable error condition. Reraise this exception!
-        raise
+    # If this requirement is versioned but this distribution's installed
+    # version fails to satisfy this requirement, raise a version conflict
+    # structurally preserving both, paralleling the "VersionConflict"
+    # exception raised by the prior "pkg_resources"-based implementation.
+    if (
+        _is_requirement_versioned(requirement) and
+        not requirement.specifier.contains(
+            distribution.version, prereleases=True)
+    ):
+        raise _RequirementVersionConflict(distribution, requirement)
+    # Else, this requirement is satisfied by this distribution.
+
+    # Return this distribution.
+    return distribution
 
 
 #FIXME: Rename to convert_requirements_dict_key_to_str() for parity with the
@@ -524,7 +837,7 @@ def get_requirement_str_from_dict_key(
     # If this requirement is constrained, return the concatenation of this
     # requirement's name and constraints.
     if requirement_constraints:
-        return '{} {}'.format(requirement_name, requirement_constraints)
+        return f'{requirement_name} {requirement_constraints}'
     # Else, return only this requirement's name.
     else:
         return requirement_name
@@ -570,56 +883,59 @@ def get_requirement_synopsis(requirement: Requirement) -> str:
     # Avoid circular import dependencies.
     from betse.util.py.module import pymodule
 
-    # Distribution satisfying this requirement if any or "None" otherwise.
-    distribution = None
+    # Unique key identifying this requirement.
+    requirement_key = str(requirement)
 
-    try:
-        # Object describing the currently installed version of the package or
-        # module satisfying this requirement if any or "None" if this
-        # requirement cannot be guaranteed to be unsatisfied.
-        distribution = get_requirement_distribution_or_none(requirement)
-    # If setuptools found only requirements of insufficient version, return
+    # If a prior call already synopsized this requirement, return that
+    # synopsis. Synopses are repeatedly requested for the same canonical
+    # requirements (e.g., by metadata printers and error handlers), so this
+    # memoization reduces repeat calls to a single dictionary lookup.
+    requirement_synopsis = _requirement_key_to_synopsis.get(requirement_key)
+    if requirement_synopsis is not None:
+        return requirement_synopsis
+
+    # Memoized resolution of this requirement, computed exactly once per
+    # process and shared with the requirement validators above.
+    resolution = _resolve_requirement(requirement)
+
+    # If only a distribution of insufficient version was found, return
     # this version regardless (with a suffix noting this to be the case).
-    except VersionConflict as version_conflict:
-        return '{} [fails to satisfy {}]'.format(
-            version_conflict.dist.version, version_conflict.req)
-    #FIXME: Handle the "UnknownExtra" exception as well.
+    if resolution.version_conflict is not None:
+        requirement_synopsis = '{} [fails to satisfy {}]'.format(
+            resolution.version_conflict.dist.version,
+            resolution.version_conflict.req)
+        _requirement_key_to_synopsis[requirement_key] = requirement_synopsis
+        return requirement_synopsis
 
-    # Attempt to manually import this module or package.
-    try:
-        package = import_requirement(requirement)
     # If this package is unimportable, return a human-readable string.
-    except ImportError:
+    if resolution.import_error is not None:
+        _requirement_key_to_synopsis[requirement_key] = 'not installed'
         return 'not installed'
 
-    # Pathname and version of this module or package.
-    package_pathname = pymodule.get_filename(package)
-    package_version = None
-
-    # If this requirement is satisfied, reuse the version provided by this
-    # requirement's high-level distribution -- which is guaranteed to be at
-    # least as precise as version metadata provided by this requirement's
-    # low-level module or package (if any).
+    # Pathname of this module or package.
     #
-    # Unfortunately, although the "Distribution" class does provide a public
-    # "location" instance variable, this variable's value is typically the
-    # absolute path of the parent directory containing this module or package
-    # rather than the absolute path of the latter. The former is overly
-    # ambiguous and hence useless for our purposes. We have no recourse but to
-    # manually import this module or package and inspect its attributes.
-    if distribution is not None:
-        package_version = distribution.version
-    # Else, this requirement is unsatisfied. Fallback to the version metadata
-    # provided by this requirement's low-level module or package.
-    else:
-        package_version = pymodule.get_version_or_none(package)
-
-        # If no such version is provided, default to a human-readable string.
-        if package_version is None:
-            package_version = 'unknown version'
+    # Unfortunately, although the "Distribution" class does provide version
+    # metadata, it provides *NO* unambiguous pathname for the underlying
+    # module or package. We have no recourse but to inspect the attributes of
+    # the module or package imported by the resolution above.
+    package_pathname = pymodule.get_filename(resolution.package)
+
+    # Version of this module or package -- preferring the version provided by
+    # this requirement's high-level distribution (already folded into this
+    # resolution by preference), which is guaranteed to be at least as
+    # precise as version metadata provided by this requirement's low-level
+    # module or package.
+    package_version = resolution.package_version
+
+    # If no such version is provided, default to a human-readable string.
+    if package_version is None:
+        package_version = 'unknown version'
 
     # Return the expected string in the event of success.
-    return '{} <{}>'.format(package_version, package_pathname)
+    requirement_synopsis = '{} <{}>'.format(
+        package_version, package_pathname)
+    _requirement_key_to_synopsis[requirement_key] = requirement_synopsis
+    return requirement_synopsis
 
 # ....................{ GETTERS ~ requirements : dict     }....................
 @type_check
@@ -653,32 +969,37 @@ def get_requirements_dict_from_str(
         format described above.
     '''
 
-    # List of all requirement objects parsed from these requirement strings.
-    requirements = iter_requirements_str(*requirements_tuple)
+    # List of all requirement objects parsed from these requirement
+    # strings, inlining the parse to avoid the generator boundary.
+    requirements = [
+        _parse_requirement(requirement_str)
+        for requirement_str in requirements_tuple
+    ]
 
     # Dictionary containing these requirements.
     requirements_dict = {}
 
     # For each such requirement...
     for requirement in requirements:
-        # Comma-delimited string of all constraints of this requirement
-        # iteratively reduced from the high-level "specs" sequence of 2-tuples
-        # "(op, version)" of this requirement object into low-level strings.
+        # Comma-delimited string of all constraints of this requirement.
+        #
+        # The "specifier" instance variable of this requirement object already
+        # stringifies to the canonical comma-delimited form (e.g., ">=1.8.0"),
+        # rendering the prior Python-level loop over the "specs" sequence of
+        # 2-tuples "(op, version)" -- and its two string formats per
+        # constraint -- redundant.
         #
         # Technically, manually parsing each requirement string of the passed
         # tuple into the project name and specifications required below would
         # also be feasible. Since manual parsing is significantly more fragile
-        # than deferring to the authoritative parsing already implemented by
-        # the canonical "pkg_resources" module, the latter is preferred.
-        requirement_specs_str = ','.join(
-            '{} {}'.format(requirement_spec[0], requirement_spec[1])
-            for requirement_spec in requirement.specs
-        )
+        # than deferring to the authoritative parsing already performed by
+        # _parse_requirement(), the latter is preferred.
+        requirement_specs_str = str(requirement.specifier)
 
         # Add a new key-value pair to this dictionary mapping from the name of
         # this requirement to the comma-delimited string of all constraints of
         # this requirement.
-        requirements_dict[requirement.project_name] = requirement_specs_str
+        requirements_dict[requirement.name] = requirement_specs_str
 
     # Return this dictionary.
     return requirements_dict
@@ -712,8 +1033,17 @@ def get_requirements_str_from_dict(requirements_dict: MappingType) -> tuple:
         described above.
     '''
 
-    return get_requirements_str_from_dict_keys(
-        requirements_dict, *requirements_dict.keys())
+    # Convert all key-value pairs of this dictionary directly. Deferring to
+    # get_requirements_str_from_dict_keys() would needlessly splat every key
+    # onto the argument stack and re-test membership of each key in the very
+    # dictionary being iterated.
+    return tuple(
+        f'{requirement_name} {requirement_constraints}'
+        if requirement_constraints else
+        requirement_name
+        for requirement_name, requirement_constraints in (
+            requirements_dict.items())
+    )
 
 
 #FIXME: Rename to convert_requirements_dict_keys_to_tuple() for parity with the
@@ -751,18 +1081,35 @@ def get_requirements_str_from_dict_keys(
         Further details on the format of this dictionary and resulting strings.
     '''
 
+    # Set of all passed keys absent from this dictionary, computed with a
+    # single C-level set difference rather than one membership test per key.
+    requirement_names_missing = (
+        set(requirement_names) - requirements_dict.keys())
+
+    # If any passed key is absent, raise a single aggregated exception.
+    if requirement_names_missing:
+        raise BetseLibException(
+            'Dependencies {} unrecognized.'.format(', '.join(
+                '"{}"'.format(requirement_name)
+                for requirement_name in sorted(requirement_names_missing))))
+    # Else, all passed keys are keys of this dictionary.
+
+    # Convert each such key-value pair directly, avoiding both the
+    # per-key membership test and per-key function call performed by
+    # get_requirement_str_from_dict_key().
     return tuple(
-        get_requirement_str_from_dict_key(
-            requirements_dict, requirement_name)
+        f'{requirement_name} {requirements_dict[requirement_name]}'
+        if requirements_dict[requirement_name] else
+        requirement_name
         for requirement_name in requirement_names
     )
 
 # ....................{ GETTERS ~ requirements : synopsis }....................
 @type_check
 def get_requirements_dict_synopsis(
-    requirements_dict: MappingType) -> OrderedDict:
+    requirements_dict: MappingType) -> dict:
     '''
-    Ordered dictionary synopsizing the currently installed third-party packages
+    Dictionary synopsizing the currently installed third-party packages
     corresponding to (but *not* necessarily satisfying) the
     :mod:`setuptools`-formatted requirements strings produced by concatenating
     each key and value of the passed dictionary (e.g., converting key ``Numpy``
@@ -775,9 +1122,9 @@ def get_requirements_dict_synopsis(
 
     Returns
     ----------
-    OrderedDict
-        Ordered dictionary lexicographically presorted on keys in ascending
-        order such that each:
+    dict
+        Dictionary whose insertion order lexicographically presorts keys in
+        ascending order such that each:
 
         * Key is a string of the form ``{{requirement_name}} version``.
         * Value is either:
@@ -800,9 +1147,9 @@ def get_requirements_dict_synopsis(
 
 
 @type_check
-def get_requirements_str_synopsis(*requirements_str: str) -> OrderedDict:
+def get_requirements_str_synopsis(*requirements_str: str) -> dict:
     '''
-    Ordered dictionary synopsizing the currently installed third-party packages
+    Dictionary synopsizing the currently installed third-party packages
     corresponding to (but *not* necessarily satisfying) the passed
     :mod:`setuptools`-formatted requirements strings (e.g., ``Numpy >= 1.8``).
 
@@ -813,25 +1160,22 @@ def get_requirements_str_synopsis(*requirements_str: str) -> OrderedDict:
 
     Returns
     ----------
-    OrderedDict
-        Ordered dictionary lexicographically presorted on keys in ascending
-        order (as detailed by the :func:`get_requirements_dict_synopsis`
-        function).
+    dict
+        Dictionary whose insertion order lexicographically presorts keys in
+        ascending order (as detailed by the
+        :func:`get_requirements_dict_synopsis` function).
     '''
 
-    # Avoid circular import dependencies.
-    from betse.util.type.iterable import itersort
-
-    # Lexicographically sorted tuple of these strings.
-    requirement_strs_sorted = itersort.sort_ascending(requirements_str)
-
-    # List of all requirement objects parsed from these requirement strings.
-    requirements = iter_requirements_str(*requirement_strs_sorted)
-
-    # Ordered dictionary synopsizing these requirements.
-    return OrderedDict(
-        (requirement.project_name, get_requirement_synopsis(requirement))
-        for requirement in requirements)
+    # Dictionary synopsizing these requirements. Since dictionaries preserve
+    # insertion order, a plain dictionary suffices here; the "OrderedDict"
+    # subclass previously returned only added import and construction
+    # overhead. The sorted and parsed form of this tuple of strings is
+    # memoized, as the same canonical tuples (e.g., those derived from the
+    # "betse.metadeps" dictionaries) are repeatedly synopsized.
+    return {
+        requirement.name: get_requirement_synopsis(requirement)
+        for requirement in _parse_requirements_strs_sorted(requirements_str)
+    }
 
 # ....................{ IMPORTERS                         }....................
 @type_check
@@ -914,20 +1258,18 @@ def import_requirements_str(*requirements_str: str) -> ModuleOrSequenceTypes:
         Further details.
     '''
 
-    # List of all requirement objects parsed from these requirement strings.
-    requirements = iter_requirements_str(*requirements_str)
-
-    # Tuple of all modules imported from these requirement objects.
-    requirements_module = tuple(
-        import_requirement(requirement) for requirement in requirements)
+    # If passed exactly one requirement string (the common case from
+    # higher-level single-dependency importers), import and return that
+    # module directly, skipping the intermediate tuple construction below.
+    if len(requirements_str) == 1:
+        return import_requirement(_parse_requirement(requirements_str[0]))
+    # Else, two or more requirement strings were passed.
 
-    # Return:
-    #
-    # * If more than one such module was imported, this tuple of these modules.
-    # * Else, the single module imported above.
-    return (
-        requirements_module if len(requirements_module) > 1 else
-        requirements_module[0])
+    # Tuple of all modules imported from these requirement strings,
+    # inlining the parse to avoid the generator boundary.
+    return tuple(
+        import_requirement(_parse_requirement(requirement_str))
+        for requirement_str in requirements_str)
 
 
 @type_check
@@ -954,12 +1296,9 @@ def import_requirement(requirement: Requirement) -> ModuleType:
 
     # Avoid circular import dependencies.
     from betse.util.py.module import pymodname
-    from betse.util.py.module.pymodname import (
-        DEPENDENCY_TO_MODULE_NAME)
 
     # Fully-qualified name of this requirement's package.
-    package_name = DEPENDENCY_TO_MODULE_NAME[
-        requirement.project_name]
+    package_name = _get_requirement_module_name(requirement)
 
     # Log this importation, which can often have unexpected side effects.
     logs.log_debug('Importing third-party package "%s"...', package_name)
@@ -971,9 +1310,9 @@ def import_requirement(requirement: Requirement) -> ModuleType:
 @type_check
 def iter_requirements_str(*requirements_str: str) -> GeneratorType:
     '''
-    Generator iteratively yielding the high-level :mod:`setuptools`-specific
-    :class:`pkg_resources.Requirement` objects parsed from each passed
-    low-level requirement string.
+    Generator iteratively yielding the high-level
+    :class:`packaging.requirements.Requirement` objects parsed from each
+    passed low-level requirement string.
 
     Parameters
     ----------
@@ -987,4 +1326,395 @@ def iter_requirements_str(*requirements_str: str) -> GeneratorType:
         order).
     '''
 
-    yield from pkg_resources.parse_requirements(requirements_str)
+    # Yield the memoized requirement object parsed from each such string.
+    # Since the same canonical requirement strings (e.g., those produced from
+    # the "betse.metadeps" dictionaries) are reparsed throughout this
+    # application's lifetime, memoization amortizes the non-trivial cost of
+    # requirement parsing across all such calls.
+    for requirement_str in requirements_str:
+        yield _parse_requirement(requirement_str)
+
+# ....................{ CLEARERS                          }....................
+def clear_requirement_cache() -> None:
+    '''
+    Clear the memoization cache internally leveraged by the
+    :func:`iter_requirements_str` generator.
+
+    This function is principally intended for use by unit tests requiring a
+    pristine parser state (e.g., after mutating :data:`sys.path`).
+    '''
+
+    global _distribution_index
+
+    _parse_requirement.cache_clear()
+    _parse_requirements_strs_sorted.cache_clear()
+    _requirements_satisfied.clear()
+    _requirement_to_failure_message.clear()
+    _requirement_key_to_resolution.clear()
+    _requirement_key_to_synopsis.clear()
+    _distribution_index = None
+
+# ....................{ PRIVATE ~ globals                 }....................
+_distribution_index = None
+'''
+Dictionary mapping from the normalized project name of each installed
+distribution to that distribution if the :func:`_get_distribution_index`
+getter has been called under the active Python process *or* ``None``
+otherwise, deferring the single working-set scan building this index until
+distribution metadata is actually required.
+'''
+
+
+_DISTRIBUTION_NAME_UNNORMALIZED_CHARS = re.compile(r'[-_.]+')
+'''
+Compiled regular expression matching each run of characters coerced to a
+single underscore by the :func:`_normalize_distribution_name` normalizer.
+'''
+
+
+_requirements_satisfied = set()
+'''
+Set of the string representations of all requirements validated as satisfied
+by a prior call to the :func:`die_unless_requirement` validator or
+:func:`is_requirement` tester under the active Python process.
+'''
+
+
+_requirement_key_to_resolution = {}
+'''
+Dictionary mapping from the string representation of each requirement
+resolved by a prior call to the :func:`_resolve_requirement` resolver to the
+corresponding resolution, sharing imports, version lookups, and distribution
+lookups across the validation and synopsis paths.
+'''
+
+
+_requirement_key_to_synopsis = {}
+'''
+Dictionary mapping from the string representation of each requirement
+synopsized by a prior call to the :func:`get_requirement_synopsis` getter to
+the corresponding human-readable synopsis, reducing repeat synopses to a
+single dictionary lookup.
+'''
+
+
+_requirement_to_failure_message = {}
+'''
+Dictionary mapping from the string representation of each requirement
+invalidated by a prior call to the :func:`die_unless_requirement` validator or
+:func:`is_requirement` tester to the corresponding human-readable failure
+message, enabling cached failures to be re-raised without repeating the
+underlying (expensive) importation and version inspection.
+'''
+
+# ....................{ PRIVATE ~ classes                 }....................
+class _RequirementResolution(NamedTuple):
+    '''
+    Immutable metadata bag aggregating everything expensively derivable from
+    a single requirement -- its imported package, best-known version,
+    distribution, and any failures encountered doing so -- computed exactly
+    once per requirement by the :func:`_resolve_requirement` resolver and
+    shared across the validation and synopsis paths.
+
+    Attributes
+    ----------
+    package : optional[ModuleType]
+        Top-level module or package imported for this requirement if
+        importable *or* ``None`` otherwise.
+    package_version : optional[str]
+        Best-known installed version of this requirement -- preferring the
+        version declared by this requirement's distribution over version
+        attributes exported by this requirement's package -- if any *or*
+        ``None`` otherwise.
+    distribution : optional[object]
+        Distribution satisfying this requirement if any *or* ``None``
+        otherwise.
+    version_conflict : optional[_RequirementVersionConflict]
+        Version conflict raised on retrieving this distribution if any *or*
+        ``None`` otherwise.
+    import_error : optional[Exception]
+        Exception raised on importing this requirement's package if any *or*
+        ``None`` otherwise.
+    '''
+
+    package: object = None
+    package_version: object = None
+    distribution: object = None
+    version_conflict: object = None
+    import_error: object = None
+
+
+class _RequirementVersionConflict(Exception):
+    '''
+    Exception internally raised by the
+    :func:`get_requirement_distribution_or_none` getter when the currently
+    installed version of a distribution fails to satisfy a versioned
+    requirement, structurally preserving both for exception handlers.
+
+    This exception parallels the :class:`pkg_resources.VersionConflict`
+    exception previously raised by that getter, whose ``dist`` and ``req``
+    attributes are preserved here for parity.
+
+    Attributes
+    ----------
+    dist : importlib.metadata.Distribution
+        Distribution failing to satisfy this requirement.
+    req : Requirement
+        Requirement unsatisfied by this distribution.
+    '''
+
+    def __init__(self, distribution: object, requirement: Requirement) -> None:
+        super().__init__(
+            'Requirement "{}" unsatisfied by '
+            'installed distribution version {}.'.format(
+                requirement, distribution.version))
+        self.dist = distribution
+        self.req = requirement
+
+# ....................{ PRIVATE ~ resolvers               }....................
+def _resolve_requirement(requirement: Requirement) -> _RequirementResolution:
+    '''
+    Resolution of the passed requirement, memoized per requirement.
+
+    The first call for each requirement retrieves this requirement's
+    distribution, imports this requirement's package, and derives this
+    requirement's best-known version; subsequent calls (e.g., the synopsis
+    path following the validation path of the default CLI flow) reduce to a
+    single dictionary hit.
+
+    Parameters
+    ----------
+    requirement : Requirement
+        Object describing this module or package's required name and version.
+
+    Returns
+    ----------
+    _RequirementResolution
+        Resolution of this requirement.
+    '''
+
+    # Avoid circular import dependencies.
+    from betse.util.py.module import pymodule
+
+    # Unique key identifying this requirement.
+    requirement_key = str(requirement)
+
+    # If a prior call resolved this requirement, return that resolution.
+    resolution = _requirement_key_to_resolution.get(requirement_key)
+    if resolution is not None:
+        return resolution
+    # Else, this requirement has yet to be resolved.
+
+    # Distribution satisfying this requirement and conflict raised on
+    # retrieving that distribution if any.
+    distribution = None
+    version_conflict = None
+    try:
+        distribution = get_requirement_distribution_or_none(requirement)
+    except _RequirementVersionConflict as exception:
+        version_conflict = exception
+
+    # Package imported for this requirement and failure of this importation
+    # if any. All exceptions are captured rather than raised, deferring
+    # error-reporting policy to callers.
+    package = None
+    import_error = None
+    try:
+        package = import_requirement(requirement)
+    except Exception as exception:
+        import_error = exception
+
+    # Best-known version of this requirement -- preferring the version
+    # declared by this distribution, which is guaranteed to be at least as
+    # precise as version attributes exported by this package.
+    package_version = None
+    if distribution is not None:
+        package_version = distribution.version
+    elif package is not None:
+        package_version = pymodule.get_version_or_none(package)
+
+    # Memoize and return this resolution.
+    resolution = _RequirementResolution(
+        package=package,
+        package_version=package_version,
+        distribution=distribution,
+        version_conflict=version_conflict,
+        import_error=import_error,
+    )
+    _requirement_key_to_resolution[requirement_key] = resolution
+    return resolution
+
+# ....................{ PRIVATE ~ parsers                 }....................
+@lru_cache(maxsize=None)
+def _parse_requirement(requirement_str: str) -> Requirement:
+    '''
+    High-level :class:`packaging.requirements.Requirement` object parsed
+    from the passed low-level requirement string, memoized on this string.
+
+    Parameters
+    ----------
+    requirement_str : str
+        Requirement string to be parsed.
+
+    Returns
+    ----------
+    Requirement
+        Requirement parsed from this string.
+    '''
+
+    return Requirement(requirement_str)
+
+
+@lru_cache(maxsize=None)
+def _parse_requirements_strs_sorted(requirements_str: tuple) -> tuple:
+    '''
+    Tuple of the high-level :class:`packaging.requirements.Requirement`
+    objects parsed from the passed tuple of low-level requirement strings in
+    lexicographically ascending order, memoized on this tuple.
+
+    The canonical requirement tuples derived from the immutable
+    :mod:`betse.metadeps` dictionaries are repeatedly sorted and parsed by
+    synopsis functions; memoizing the sorted and parsed form computes it
+    exactly once per unique tuple per process.
+
+    Parameters
+    ----------
+    requirements_str : tuple
+        Tuple of requirement strings to be sorted and parsed.
+
+    Returns
+    ----------
+    tuple
+        Tuple of requirements parsed from these strings, sorted.
+    '''
+
+    return tuple(
+        _parse_requirement(requirement_str)
+        for requirement_str in sorted(requirements_str))
+
+# ....................{ PRIVATE ~ markers                 }....................
+def _get_requirements_dict_fingerprint(
+    requirements_dict: MappingType) -> str:
+    '''
+    Hexadecimal fingerprint uniquely identifying both the passed dictionary
+    of requirements strings and the active Python environment.
+
+    The active Python interpreter's version and prefix salt this fingerprint,
+    guaranteeing that upgrading Python or switching virtual environments
+    invalidates previously persisted markers. So does the sorted name-version
+    snapshot of all installed distributions, guaranteeing that installing,
+    upgrading, or uninstalling packages *into the same environment* (e.g.,
+    via ``pip install``) likewise invalidates these markers. This snapshot
+    derives from the index already built by a single metadata scan in the
+    :func:`_get_distribution_index` getter, which subsequent validation
+    reuses -- preserving the point of the marker, which is to skip only the
+    expensive per-requirement import probes.
+
+    Parameters
+    ----------
+    requirements_dict : MappingType
+        Dictionary of requirements strings to be fingerprinted.
+
+    Returns
+    ----------
+    str
+        Hexadecimal fingerprint of this dictionary and environment.
+    '''
+
+    # Sorted name-version snapshot of all installed distributions,
+    # canonicalizing the arbitrary iteration order of the underlying scan.
+    distributions_state = sorted(
+        (distribution_name, distribution.version)
+        for distribution_name, distribution in (
+            _get_distribution_index().items()))
+
+    return hashlib.blake2b(
+        repr((
+            sorted(requirements_dict.items()),
+            distributions_state,
+            sys.version,
+            sys.prefix,
+        )).encode('utf-8'),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _get_requirements_marker_filename_or_none() -> object:
+    '''
+    Absolute filename of the marker file persisting the fingerprint of the
+    most recently validated dictionary of requirements strings if resolvable
+    *or* ``None`` otherwise (e.g., if no application metadata singleton has
+    been set yet, in which case this application's dot directory is unknown).
+
+    Since this marker is strictly an optimization, *all* failures to resolve
+    this filename are silently coerced to ``None`` rather than raised.
+    '''
+
+    try:
+        # Avoid circular import dependencies.
+        from betse.util.app.meta import appmetaone
+        from betse.util.path import pathnames
+
+        # If no application metadata singleton has been set, the dot
+        # directory persisting this marker is unknowable.
+        if not appmetaone.is_app_meta():
+            return None
+
+        # Else, return the marker filename in this application's dot
+        # directory (e.g., "~/.betse/deps-ok").
+        return pathnames.join(
+            appmetaone.get_app_meta().dot_dirname, 'deps-ok')
+    except Exception:
+        return None
+
+
+def _is_requirements_marker_fresh(requirements_fingerprint: str) -> bool:
+    '''
+    ``True`` only if the persisted marker file both exists and records the
+    passed fingerprint, implying a prior process to have successfully
+    validated the same dictionary of requirements strings under the same
+    Python environment.
+
+    Parameters
+    ----------
+    requirements_fingerprint : str
+        Fingerprint to compare this marker file against.
+    '''
+
+    marker_filename = _get_requirements_marker_filename_or_none()
+    if marker_filename is None:
+        return False
+
+    # Since this marker is strictly an optimization, treat *ANY* failure to
+    # read this file (e.g., non-existence, permissions) as a stale marker.
+    try:
+        with open(marker_filename) as marker_file:
+            return marker_file.read() == requirements_fingerprint
+    except OSError:
+        return False
+
+
+def _write_requirements_marker(requirements_fingerprint: str) -> None:
+    '''
+    Persist the passed fingerprint to the marker file, enabling subsequent
+    processes validating the same dictionary of requirements strings under
+    the same Python environment to skip revalidation.
+
+    Since this marker is strictly an optimization, failures to write this
+    file (e.g., read-only home directories) are silently ignored.
+
+    Parameters
+    ----------
+    requirements_fingerprint : str
+        Fingerprint to be persisted.
+    '''
+
+    marker_filename = _get_requirements_marker_filename_or_none()
+    if marker_filename is None:
+        return
+
+    try:
+        with open(marker_filename, 'w') as marker_file:
+            marker_file.write(requirements_fingerprint)
+    except OSError:
+        pass
@@ -24,28 +24,6 @@ would render these constants effectively useless for their principal use case.
 # towards which we should refactor this project away from this submodule.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-#FIXME: Setuptools should no longer be required at runtime under Python >= 3.8.
-#Why? Because Python 3.8 wisely introduced the new "importlib.metadata" module,
-#enabling inspection of package manager-installed metadata (e.g., version,
-#dependencies, entry points) *WITHOUT* requiring that manager to be installed.
-#"importlib.metadata" is likely to be substantially more efficient than the
-#setuptools-specific "pkg_resources" and "setuptools" packages, which are
-#well-known to be CPU bottlenecks. Of course, supporting this sanely will
-#necessitate that we refactor the codebase as follows:
-#
-#* Define a new "betse.util.py.pyproject" submodule, providing high-level
-#  access to project-specific metadata rather than lower-level module- or
-#  package-specific metadata. This submodule should define functions generally
-#  resembling those already defined by the "betse.lib.setuptools.setuptool"
-#  submodule as follows:
-#  * If this is Python >= 3.8, these functions should be implemented in terms
-#    of the new "importlib.metadata" submodule.
-#  * If this is Python < 3.8, these functions should be implemented in terms
-#    of the old "betse.lib.setuptools.setuptool" submodule.
-#
-#For backward compatibility, the "betse.lib.setuptools.setuptool" submodule
-#should be preserved in perpetuity as is. It works, so don't break it! Please.
-
 # ....................{ IMPORTS                            }....................
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 # WARNING: To avoid race conditions during setuptools-based installation, this
@@ -96,10 +74,13 @@ bundled (albeit deprecated) :mod:`setuptools.pkg_resources` subpackage.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
 RUNTIME_MANDATORY = {
-    # setuptools is currently still required at runtime for the deprecated
-    # "setuptools.pkg_resources" subpackage. At runtime, setuptools is used to
-    # validate that dependencies are available.
-    'setuptools': '>= ' + SETUPTOOLS_VERSION_MIN,
+    # At runtime, dependency validation is implemented in terms of the
+    # standard "importlib.metadata" API and the third-party "packaging"
+    # package -- replacing the deprecated (and substantially slower)
+    # "pkg_resources" subpackage previously requiring setuptools itself as a
+    # runtime dependency. Note that setuptools remains required at both
+    # install- and test time (e.g., by "tox").
+    'packaging': '>= 20.9',
 
     # Scientific stack. Dismantled, this is:
     # * Numpy 2.0.0 introduced wide-sweeping changes, including permanent
@@ -177,12 +158,10 @@ sequences rather than dictionaries of strings. While undocumented, these keys
 
 Caveats
 ----------
-This application requires :mod:`setuptools` at both installation time *and*
-runtime -- in the latter case, to validate all application dependencies at
-runtime. Note that doing so technically only requires the :mod:`pkg_resources`
-package installed with :mod:`setuptools` rather than the :mod:`setuptools`
-package itself. Since there exists no means of asserting a dependency on only
-:mod:`pkg_resources`, however, :mod:`setuptools` is depended upon instead.
+This application requires :mod:`setuptools` at installation time but *not* at
+runtime. Runtime dependency validation is implemented in terms of the standard
+:mod:`importlib.metadata` API and the third-party :mod:`packaging` package,
+neither of which require a package manager to be installed.
 
 See Also
 ----------
@@ -203,6 +182,11 @@ RUNTIME_OPTIONAL = {
     'pympler':  '>= 0.4.1',
     'ptpython': '>= 0.29',
 
+    # When importable, numexpr accelerates the bandwidth-bound per-timestep
+    # channel gating updates (e.g., ChannelsABC.update_mh()) by evaluating
+    # each update as a single cache-blocked, multithreaded kernel.
+    'numexpr': '>= 2.8.0',
+
     #FIXME: Uncomment once eventually used, which is probably inevitable now.
     # 'psutil':   '>= 5.3.0',
 
@@ -292,6 +276,81 @@ See Also
 '''
 
 
+RUNTIME_MANDATORY_ITEMS = tuple(RUNTIME_MANDATORY.items())
+'''
+Tuple of the key-value pairs of the :data:`RUNTIME_MANDATORY` dictionary.
+
+Consumers that only iterate these pairs should prefer this precomputed tuple,
+which avoids per-call dictionary view construction and -- unlike the
+dictionary itself -- is hashable and hence usable as a memoization key.
+Consumers requiring by-name lookup should retain the dictionary.
+'''
+
+
+RUNTIME_OPTIONAL_ITEMS = tuple(RUNTIME_OPTIONAL.items())
+'''
+Tuple of the key-value pairs of the :data:`RUNTIME_OPTIONAL` dictionary.
+
+See Also
+----------
+:data:`RUNTIME_MANDATORY_ITEMS`
+    Further details.
+'''
+
+
+TESTING_MANDATORY_ITEMS = tuple(TESTING_MANDATORY.items())
+'''
+Tuple of the key-value pairs of the :data:`TESTING_MANDATORY` dictionary.
+
+See Also
+----------
+:data:`RUNTIME_MANDATORY_ITEMS`
+    Further details.
+'''
+
+
+RUNTIME_MANDATORY_STRS = tuple(
+    f'{project_name} {constraints}' if constraints else project_name
+    for project_name, constraints in RUNTIME_MANDATORY.items())
+'''
+Tuple of :mod:`setuptools`-specific requirements strings precomputed from the
+:data:`RUNTIME_MANDATORY` dictionary.
+
+Since that dictionary is immutable after module import, this derived form is
+deterministic and is computed exactly once here -- sparing consumers both the
+per-call concatenation and providing a hashable key for memoized requirement
+machinery (e.g., :mod:`betse.lib.setuptools.setuptool`).
+'''
+
+
+RUNTIME_OPTIONAL_STRS = tuple(
+    f'{project_name} {constraints}' if constraints else project_name
+    for project_name, constraints in RUNTIME_OPTIONAL.items())
+'''
+Tuple of :mod:`setuptools`-specific requirements strings precomputed from the
+:data:`RUNTIME_OPTIONAL` dictionary.
+
+See Also
+----------
+:data:`RUNTIME_MANDATORY_STRS`
+    Further details.
+'''
+
+
+TESTING_MANDATORY_STRS = tuple(
+    f'{project_name} {constraints}' if constraints else project_name
+    for project_name, constraints in TESTING_MANDATORY.items())
+'''
+Tuple of :mod:`setuptools`-specific requirements strings precomputed from the
+:data:`TESTING_MANDATORY` dictionary.
+
+See Also
+----------
+:data:`RUNTIME_MANDATORY_STRS`
+    Further details.
+'''
+
+
 LIBS_TESTTIME_MANDATORY_COVERAGE = (
     'coverage >=5.5',
 )
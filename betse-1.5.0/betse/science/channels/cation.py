@@ -9,9 +9,7 @@ Cation leak channel classes.
 # .................... IMPORTS                            ....................
 import numpy as np
 from abc import ABCMeta, abstractmethod
-from betse.science import sim_toolbox as stb
 from betse.science.channels.channelsabc import ChannelsABC
-from betse.science.math import toolbox as tb
 from betse.util.io.log import logs
 
 
@@ -9,9 +9,7 @@ Voltage-gated calcium channel classes.
 # .................... IMPORTS                            ....................
 from abc import ABCMeta, abstractmethod
 import numpy as np
-from betse.science import sim_toolbox as stb
 from betse.science.channels.channelsabc import ChannelsABC
-from betse.science.math import toolbox as tb
 from betse.util.io.log import logs
 
 # .................... BASE                               ....................
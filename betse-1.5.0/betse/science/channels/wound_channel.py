@@ -10,9 +10,7 @@ Wound-induced transient channel response classes.
 from abc import ABCMeta, abstractmethod
 import numpy as np
 from betse.exceptions import BetseSimConfException
-from betse.science import sim_toolbox as stb
 from betse.science.channels.channelsabc import ChannelsABC
-from betse.science.math import toolbox as tb
 from betse.util.io.log import logs
 # from betse.science.chemistry.molecule import get_influencers
 
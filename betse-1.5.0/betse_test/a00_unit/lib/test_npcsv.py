@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.lib.numpy.npcsv` submodule.
+'''
+
+# ....................{ TESTS                              }....................
+def test_write_csv_uniform_parity(
+    betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Unit test the :func:`betse.lib.numpy.npcsv.write_csv` function on a
+    uniformly formatted export, asserting the output of its vectorized fast
+    path to be byte-identical to that of the :func:`numpy.savetxt` path it
+    bypasses.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    from io import StringIO
+    import numpy as np
+    from betse.lib.numpy.npcsv import write_csv
+
+    # Absolute filename of the CSV file to be written.
+    csv_filepath = betse_temp_dir.join('Kobayashi_Maru.csv')
+
+    # Dictionary of small floating-point columns exercising negative,
+    # fractional, and large magnitudes under the default '%.18e' format.
+    column_name_to_values = {
+        'time': np.asarray([0.0, 0.5, 1.0, 1.5]),
+        'Vmem': np.asarray([-0.055, -0.0551, 2.5e-2, 1.0e6]),
+        'flux': np.asarray([1.0, -2.0, 3.0, -4.0]),
+    }
+
+    # Serialize these columns via the vectorized uniform writer.
+    write_csv(
+        filename=str(csv_filepath),
+        column_name_to_values=column_name_to_values,
+    )
+
+    # Reference output serialized by np.savetxt() with identical parameters.
+    reference = StringIO()
+    np.savetxt(
+        fname=reference,
+        X=np.column_stack(tuple(column_name_to_values.values())),
+        fmt='%.18e',
+        header=','.join(column_name_to_values.keys()),
+        delimiter=',',
+        comments='',
+    )
+
+    # Assert both serializations to be byte-identical.
+    assert csv_filepath.read() == reference.getvalue()
+
+
+def test_write_csv_wide(betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Unit test the :func:`betse.lib.numpy.npcsv.write_csv` function on an
+    export wider than 64 columns, exceeding the ``NPY_MAXARGS`` operand cap
+    of a single variadic :func:`numpy.result_type` call.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.lib.numpy.npcsv import write_csv
+
+    # Absolute filename of the CSV file to be written.
+    csv_filepath = betse_temp_dir.join('Wolf_359.csv')
+
+    # Dictionary of more than 64 single-row columns.
+    column_name_to_values = {
+        'column_{}'.format(column_index): np.asarray([float(column_index)])
+        for column_index in range(70)
+    }
+
+    # Serialize these columns.
+    write_csv(
+        filename=str(csv_filepath),
+        column_name_to_values=column_name_to_values,
+    )
+
+    # List of all lines of this file.
+    csv_lines = csv_filepath.read().splitlines()
+
+    # Assert this file to comprise a header line and a single data row of the
+    # expected width.
+    assert len(csv_lines) == 2
+    assert csv_lines[0] == ','.join(column_name_to_values.keys())
+    assert len(csv_lines[1].split(',')) == 70
+
+
+def test_write_csv_one_column(
+    betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Unit test the :func:`betse.lib.numpy.npcsv.write_csv` function on an
+    export of exactly one column, degenerating the pairwise dtype promotion
+    over all columns to its seed.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    from io import StringIO
+    import numpy as np
+    from betse.lib.numpy.npcsv import write_csv
+
+    # Absolute filename of the CSV file to be written.
+    csv_filepath = betse_temp_dir.join('Jeffries_Tube.csv')
+
+    # Dictionary of exactly one column.
+    column_name_to_values = {'time': np.asarray([0.0, 0.5, 1.0])}
+
+    # Serialize this column.
+    write_csv(
+        filename=str(csv_filepath),
+        column_name_to_values=column_name_to_values,
+    )
+
+    # Reference output serialized by np.savetxt() with identical parameters.
+    reference = StringIO()
+    np.savetxt(
+        fname=reference,
+        X=np.column_stack(tuple(column_name_to_values.values())),
+        fmt='%.18e',
+        header='time',
+        delimiter=',',
+        comments='',
+    )
+
+    # Assert both serializations to be byte-identical.
+    assert csv_filepath.read() == reference.getvalue()
+
+
+def test_write_csv_list_columns(
+    betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Unit test the :func:`betse.lib.numpy.npcsv.write_csv` function on columns
+    passed as plain Python lists rather than Numpy arrays, which this
+    function's type signature and validation explicitly admit.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.lib.numpy.npcsv import write_csv
+
+    # Absolute filename of the CSV file to be written.
+    csv_filepath = betse_temp_dir.join('Lower_Decks.csv')
+
+    # Dictionary of columns passed as plain lists and tuples.
+    column_name_to_values = {
+        'time': [0.0, 1.0],
+        'Vmem': (-0.055, -0.0551),
+    }
+
+    # Serialize these columns.
+    write_csv(
+        filename=str(csv_filepath),
+        column_name_to_values=column_name_to_values,
+    )
+
+    # List of all lines of this file.
+    csv_lines = csv_filepath.read().splitlines()
+
+    # Assert this file to comprise a header line and two data rows whose
+    # cells roundtrip to the expected values.
+    assert len(csv_lines) == 3
+    assert csv_lines[0] == 'time,Vmem'
+    assert [float(cell) for cell in csv_lines[1].split(',')] == [0.0, -0.055]
+    assert [float(cell) for cell in csv_lines[2].split(',')] == [1.0, -0.0551]
+
+
+def test_write_csv_no_columns(
+    betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Unit test the :func:`betse.lib.numpy.npcsv.write_csv` function on an
+    empty column dictionary, asserting a human-readable exception to be
+    raised.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.exceptions import BetseSequenceException
+    from betse.lib.numpy.npcsv import write_csv
+    from pytest import raises
+
+    # Assert serializing no columns to raise the documented exception.
+    with raises(BetseSequenceException):
+        write_csv(
+            filename=str(betse_temp_dir.join('Nagilum.csv')),
+            column_name_to_values={},
+        )
+
+
+def test_write_csv_empty(betse_temp_dir: 'py._path.local.LocalPath') -> None:
+    '''
+    Unit test the :func:`betse.lib.numpy.npcsv.write_csv` function on a
+    zero-row export, asserting only the header line to be written (as
+    :func:`numpy.savetxt` does) with *no* trailing blank line.
+
+    Parameters
+    ----------
+    betse_temp_dir : py._path.local.LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.lib.numpy.npcsv import write_csv
+
+    # Absolute filename of the CSV file to be written.
+    csv_filepath = betse_temp_dir.join('Empty_Nest.csv')
+
+    # Dictionary of zero-row columns.
+    column_name_to_values = {
+        'time': np.asarray([]),
+        'Vmem': np.asarray([]),
+    }
+
+    # Serialize these columns.
+    write_csv(
+        filename=str(csv_filepath),
+        column_name_to_values=column_name_to_values,
+    )
+
+    # Assert this file to contain only the header line.
+    assert csv_filepath.read() == 'time,Vmem\n'
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2025 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.lib.setuptools.setuptool` submodule.
+'''
+
+# ....................{ TESTS                              }....................
+def test_normalize_distribution_name() -> None:
+    '''
+    Unit test the
+    :func:`betse.lib.setuptools.setuptool._normalize_distribution_name`
+    normalizer, asserting all spellings of the same project name accepted by
+    the :mod:`importlib.metadata` API to normalize identically.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.lib.setuptools.setuptool import _normalize_distribution_name
+
+    # Assert hyphens, underscores, and periods to be interchangeable.
+    assert _normalize_distribution_name('ruamel.yaml') == 'ruamel_yaml'
+    assert _normalize_distribution_name('ruamel-yaml') == 'ruamel_yaml'
+    assert _normalize_distribution_name('ruamel_yaml') == 'ruamel_yaml'
+
+    # Assert normalization to lowercase and to collapse character runs.
+    assert _normalize_distribution_name('Ruamel.YAML') == 'ruamel_yaml'
+    assert _normalize_distribution_name('ruamel-_.yaml') == 'ruamel_yaml'
+
+    # Assert already-normalized names to pass through unmodified.
+    assert _normalize_distribution_name('numpy') == 'numpy'
+
+
+def test_die_unless_requirement_str() -> None:
+    '''
+    Unit test the
+    :func:`betse.lib.setuptools.setuptool.die_unless_requirements_str`
+    validator against both versioned and unversioned requirements strings,
+    both satisfiable and not.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.exceptions import BetseLibException
+    from betse.lib.setuptools import setuptool
+    from pytest import raises
+
+    # Validate from a pristine cache, exercising the uncached code paths.
+    setuptool.clear_requirement_cache()
+
+    # Assert an unversioned requirement on an importable package (pytest,
+    # guaranteed installed under this test suite) to be satisfied.
+    setuptool.die_unless_requirements_str('pytest')
+
+    # Assert a versioned requirement trivially satisfied by any installed
+    # version of this package to be satisfied.
+    setuptool.die_unless_requirements_str('pytest >= 0.0.1')
+
+    # Assert an unversioned requirement on a nonexistent package to raise.
+    with raises(BetseLibException):
+        setuptool.die_unless_requirements_str(
+            'Zefram_Cochranes_Phoenix_Warp_Drive')
+
+    # Assert a versioned requirement unsatisfiable by any installed version
+    # of this package to raise -- both uncached and, repeated, from the
+    # memoized failure message.
+    for _ in range(2):
+        with raises(BetseLibException):
+            setuptool.die_unless_requirements_str('pytest >= 9999.9.9')
+
+    # Revert to a pristine cache for subsequent tests.
+    setuptool.clear_requirement_cache()
+
+
+def test_clear_requirement_cache() -> None:
+    '''
+    Unit test the
+    :func:`betse.lib.setuptools.setuptool.clear_requirement_cache` function,
+    asserting all memoization caches internally leveraged by this submodule
+    to be restored to their pristine states.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.lib.setuptools import setuptool
+
+    # Populate the parser, verdict, and distribution-index caches.
+    setuptool.die_unless_requirements_str('pytest', 'pytest >= 0.0.1')
+    assert setuptool._distribution_index is not None
+    assert setuptool._requirements_satisfied
+    assert setuptool._parse_requirement.cache_info().currsize
+
+    # Clear all such caches.
+    setuptool.clear_requirement_cache()
+
+    # Assert all such caches to be pristine.
+    assert setuptool._distribution_index is None
+    assert not setuptool._requirements_satisfied
+    assert not setuptool._requirement_to_failure_message
+    assert not setuptool._requirement_key_to_resolution
+    assert not setuptool._requirement_key_to_synopsis
+    assert not setuptool._parse_requirement.cache_info().currsize
+    assert not setuptool._parse_requirements_strs_sorted.cache_info().currsize
@@ -1,3 +1,5 @@
+import copy
+
 from rest_framework import serializers
 
 from _betse import DEFAULT_BETSE_GRNC
@@ -50,4 +52,6 @@ class OptimizationSerializer(serializers.Serializer):
 class GRNConfigSerializer(serializers.Serializer):
     enable_mitochondria = serializers.BooleanField(default=False, help_text="Enable distinct mitochondrial volumes?")
     optimization = OptimizationSerializer()
-    biomolecules = BiomoleculeSerializer(many=True, default=DEFAULT_BETSE_GRNC.copy()["biomolecules"])
+    # Deep-copy just the needed subtree: dict.copy() is shallow, so the
+    # serializer default would alias (and mutate) the shared parsed template.
+    biomolecules = BiomoleculeSerializer(many=True, default=copy.deepcopy(DEFAULT_BETSE_GRNC["biomolecules"]))
@@ -1,6 +1,5 @@
 import os
 
-import yaml
 from django.http import FileResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -8,6 +7,7 @@ from rest_framework import status
 from rest_framework import serializers
 
 from _betse.grn_predictor.s import GRNConfigSerializer
+from _betse.yml import dump_yaml
 
 
 class S(serializers.Serializer):
@@ -24,7 +24,7 @@ class CreatGrnView(APIView):
         os.makedirs(new_folder_path, exist_ok=True)
 
         file_path=os.path.join(new_folder_path, f"grn_conf_{user_id}.yaml")
-        yaml_content = yaml.dump(validated_data, default_flow_style=False, sort_keys=False)
+        yaml_content = dump_yaml(validated_data)
         with open(file_path, "w") as f:
             f.write(yaml_content)
         return file_path
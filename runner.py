@@ -2,7 +2,7 @@
 import shutil
 import subprocess
 
-import yaml
+from _betse.yml import dump_yaml
 
 
 #from utils.ggoogle.vertexai import ask_gem
@@ -47,7 +47,7 @@ class BetseRunner:
 
                 with open(save_logs_path, "w") as f:
                     print(v)
-                    wcontent=yaml.dump(v, default_flow_style=False, sort_keys=False)
+                    wcontent=dump_yaml(v)
                     f.write(wcontent)
 
         if zip is True:
@@ -1,3 +1,5 @@
+import copy
+
 from django.core.validators import FileExtensionValidator
 from rest_framework import serializers
 
@@ -335,9 +337,10 @@ class CutProfileSerializer(serializers.Serializer):
     )
 
 
-default_profile_struct = DEFAULT_BETSE_CONTENT["tissue profile definition"]["tissue"]["profiles"]
-for struct in default_profile_struct:
-    struct["cell targets"]["image"] = struct["cell targets"]["image"]
+# Deep-copy the profile subtree so serializer defaults never alias (or
+# mutate) the shared parsed template.
+default_profile_struct = copy.deepcopy(
+    DEFAULT_BETSE_CONTENT["tissue profile definition"]["tissue"]["profiles"])
 
 
 
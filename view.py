@@ -7,18 +7,28 @@ from django.http import FileResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-import yaml
 
-from _betse import DEFAULT_BETSE_GEOP
+from _betse import BETSE_EXTRA_CONFIGS_DIR, DEFAULT_BETSE_GEOP
 from _betse.runner import BetseRunner
 from _betse.s.main import BetseConfigSerializer
+from _betse.yml import load_yaml, load_yaml_str, dump_yaml
 from bm.settings import TEST_USER_ID
-from utils.file.yaml import load_yaml
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# The reference extra_configs directory is static, so list it once at import
+# instead of re-hitting the filesystem on every request.
+BASE_REF_FILE_PATH = BETSE_EXTRA_CONFIGS_DIR
+
+# Only actual YAML configs: anything else dropped into this directory
+# (editor backups, caches, ...) must not be served as a config.
+EXTRA_CONFIG_FILES = tuple(sorted(
+    f for f in os.listdir(BASE_REF_FILE_PATH)
+    if f.endswith(('.yaml', '.yml'))
+))
+
 def replace_underscores_in_keys(attributes):
     """Recursively replaces underscores with spaces in all dict keys, including nested ones."""
     if isinstance(attributes, dict):
@@ -171,19 +181,14 @@ class BetseSimulationView(APIView):
 
         :return: dict include file_name and
         """
-        if os.name == "nt":
-            base_ref_file_path = r"C:\Users\wired\OneDrive\Desktop\base_dj\_betse\betse-1.5.0\betse\data\yaml\extra_configs"
-        else:
-            base_ref_file_path = "_betse/betse-1.5.0/betse/data/yaml/extra_configs"
-
         file_paths = {}
-        for f in os.listdir(base_ref_file_path):
+        for f in EXTRA_CONFIG_FILES:
             file_name = f.split("/")[-1].split(".")[0]
             save_path = os.path.join(base_path, f"{f}")
             # check for missing fields
             if files.get(file_name) is None:
                 print(f"File {f} not provided")
-                yaml_confc = load_yaml(os.path.join(base_ref_file_path, f"{f}"))
+                yaml_confc = load_yaml(os.path.join(BASE_REF_FILE_PATH, f"{f}"))
             else:
                 print(f"Provided {f}")
                 # Write the file to dest data dir (gz folder)
@@ -191,7 +196,7 @@ class BetseSimulationView(APIView):
                 save_path = os.path.join(base_path, f"{f}")
 
             with open(save_path, "w") as yf:
-                yf.write(yaml.dump(yaml_confc, default_flow_style=False, sort_keys=False))
+                yf.write(dump_yaml(yaml_confc))
 
             file_paths[file_name] = save_path
 
@@ -204,7 +209,7 @@ class BetseSimulationView(APIView):
         # Read received cfg
         try:
             file_content = uploaded_file.read().decode('utf-8')
-            validated_data = yaml.safe_load(file_content)
+            validated_data = load_yaml_str(file_content)
         except Exception as e:
             error = f"Error handling provided config file: {e}"
             # print(error)
@@ -248,7 +253,7 @@ class BetseSimulationView(APIView):
 
         # save adapted content
         config_path = os.path.abspath(os.path.join(save_base_path, f"sim_config_file.yaml"))
-        yaml_confc = yaml.dump(validated_data, default_flow_style=False, sort_keys=False)
+        yaml_confc = dump_yaml(validated_data)
         with open(config_path, "w") as yf:
             yf.write(yaml_confc)
 
@@ -0,0 +1,69 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+import yaml
+
+# Use the libyaml C loader/dumper when PyYAML was built against it
+# (~2-3x faster tokenization); fall back to the pure-Python classes so
+# environments without libyaml keep working.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Directory the pickle caches live in, deliberately *outside* the
+# source trees: several callers (e.g. the extra_configs listing in
+# view.py) enumerate config directories wholesale, so sidecars written
+# next to the YAML would themselves get picked up as configs.
+_CACHE_DIR = os.path.join(tempfile.gettempdir(), "betse_yaml_cache")
+
+
+def _cache_path(filepath):
+    """Cache filename for a source YAML path, keyed by its absolute path."""
+    digest = hashlib.blake2b(
+        os.path.abspath(filepath).encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(_CACHE_DIR, digest + ".pkl")
+
+
+def load_yaml(filepath):
+    """
+    Load a YAML file, keeping a pickle cache in a scratch directory.
+
+    The configs are effectively immutable in production, so reparsing
+    YAML in every worker is wasted work; unpickling the cached tree is
+    an order of magnitude faster. The cache is keyed by the source
+    mtime and rebuilt whenever the YAML changes.
+    """
+    mtime = os.stat(filepath).st_mtime_ns
+    cache_path = _cache_path(filepath)
+
+    try:
+        with open(cache_path, "rb") as cf:
+            cached_mtime, data = pickle.load(cf)
+        if cached_mtime == mtime:
+            return data
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    with open(filepath, "r") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    # Atomic write so concurrent workers never see a half-written cache.
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as cf:
+            pickle.dump((mtime, data), cf, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return data
+
+
+def load_yaml_str(content):
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def dump_yaml(data):
+    return yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)